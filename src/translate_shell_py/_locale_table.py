@@ -0,0 +1,175 @@
+# Generated from locale_data.py by `python -m translate_shell_py.locale_data`, do not edit.
+
+FIELDS = ('name', 'endonym', 'translations-of', 'definitions-of', 'synonyms', 'examples', 'see-also', 'family', 'branch', 'iso', 'glotto', 'script', 'spoken-in', 'supported-by', 'endonym2', 'rtl', 'name2', 'dictionary', 'written-in', 'name3', 'description', 'name4')
+
+TABLE = (
+    ('af', 'Afrikaans', 'Afrikaans', 'Vertalings van %s', 'Definisies van %s', 'Sinonieme', 'Voorbeelde', 'Sien ook', 'Indo-European', 'West Germanic', 'afr', 'afri1274', 'Latn', 'South Africa; Namibia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('sq', 'Albanian', 'Shqip', 'Përkthimet e %s', 'Përkufizime të %s', 'Sinonime', 'Shembuj', 'Shihni gjithashtu', 'Indo-European', 'Paleo-Balkan', 'sqi', 'alba1267', 'Latn', 'Albania; Kosovo; Montenegro; North Macedonia', 'google; bing; yandex', 'Gjuha shqipe', None, None, None, None, None, None, None),
+    ('am', 'Amharic', 'አማርኛ', 'የ %s ትርጉሞች', 'የ %s ቃላት ፍችዎች', 'ተመሳሳይ ቃላት', 'ምሳሌዎች', 'የሚከተለውንም ይመልከቱ', 'Afro-Asiatic', 'Semitic', 'amh', 'amha1245', 'Ethi', 'Ethiopia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ar', 'Arabic', 'العربية', 'ترجمات %s', 'تعريفات %s', 'مرادفات', 'أمثلة', 'انظر أيضًا', 'Afro-Asiatic', 'Semitic', 'ara', 'stan1318', 'Arab', 'the Arab world', 'google; bing; yandex', None, 'true', None, None, None, None, None, None),
+    ('hy', 'Armenian', 'Հայերեն', '%s-ի թարգմանությունները', '%s-ի սահմանումները', 'Հոմանիշներ', 'Օրինակներ', 'Տես նաև', 'Indo-European', None, 'hye', 'nucl1235', 'Armn', 'Armenia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('as', 'Assamese', 'অসমীয়া', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'asm', 'assa1263', 'Beng', 'the northeastern Indian state of Assam', 'google; bing', None, None, None, None, None, None, None, None),
+    ('ay', 'Aymara', 'Aymar aru', None, None, None, None, None, 'Aymaran', None, 'aym', 'nucl1667', 'Latn', 'Bolivia; Peru', 'google', None, None, None, None, None, None, None, None),
+    ('az', 'Azerbaijani', 'Azərbaycanca', '%s sözünün tərcüməsi', '%s sözünün tərifləri', 'Sinonimlər', 'Nümunələr', 'Həmçinin, baxın:', 'Turkic', 'Oghuz', 'aze', 'nort2697', 'Latn', 'Azerbaijan', 'google; bing; yandex', None, None, 'Azeri', None, None, None, None, None),
+    ('bm', 'Bambara', 'Bamanankan', None, None, None, None, None, 'Mande', 'Manding', 'bam', 'bamb1269', 'Latn', 'Mali', 'google', 'Bamana', None, None, None, None, None, None, None),
+    ('ba', 'Bashkir', 'Башҡортса', None, None, None, None, None, 'Turkic', 'Kipchak', 'bak', 'bash1264', 'Cyrl', 'the Republic of Bashkortostan in Russia', 'bing; yandex', 'башҡорт теле', None, None, None, None, None, None, None),
+    ('eu', 'Basque', 'Euskara', '%s esapidearen itzulpena', 'Honen definizioak: %s', 'Sinonimoak', 'Adibideak', 'Ikusi hauek ere', 'Language isolate', None, 'eus', 'basq1248', 'Latn', 'Euskal Herria in Spain and France', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('be', 'Belarusian', 'беларуская', 'Пераклады %s', 'Вызначэннi %s', 'Сінонімы', 'Прыклады', 'Гл. таксама', 'Indo-European', 'East Slavic', 'bel', 'bela1254', 'Cyrl', 'Belarus', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('bn', 'Bengali', 'বাংলা', '%s এর অনুবাদ', '%s এর সংজ্ঞা', 'প্রতিশব্দ', 'উদাহরণ', 'আরো দেখুন', 'Indo-European', 'Indo-Aryan', 'ben', 'beng1280', 'Beng', 'Bangladesh; India', 'google; bing; yandex', None, None, 'Bangla', None, None, None, None, None),
+    ('bho', 'Bhojpuri', 'भोजपुरी', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'bho', 'bhoj1246', 'Deva', 'India; Nepal; Fiji', 'google', None, None, None, None, None, None, None, None),
+    ('bs', 'Bosnian', 'Bosanski', 'Prijevod za: %s', 'Definicije za %s', 'Sinonimi', 'Primjeri', 'Pogledajte i', 'Indo-European', 'South Slavic', 'bos', 'bosn1245', 'Latn', 'Bosnia and Herzegovina', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('br', 'Breton', 'Brezhoneg', None, None, None, None, None, 'Indo-European', 'Celtic', 'bre', 'bret1244', 'Latn', 'Brittany in France', '', None, None, None, None, None, None, None, None),
+    ('bg', 'Bulgarian', 'български', 'Преводи на %s', 'Дефиниции за %s', 'Синоними', 'Примери', 'Вижте също', 'Indo-European', 'South Slavic', 'bul', 'bulg1262', 'Cyrl', 'Bulgaria', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('yue', 'Cantonese', '粵語', None, None, None, None, None, 'Sino-Tibetan', 'Sinitic', 'yue', 'cant1236', 'Hant', 'southeastern China; Hong Kong; Macau', 'bing', '廣東話', None, None, None, None, None, None, None),
+    ('ca', 'Catalan', 'Català', 'Traduccions per a %s', 'Definicions de: %s', 'Sinònims', 'Exemples', 'Vegeu també', 'Indo-European', 'Western Romance', 'cat', 'stan1289', 'Latn', 'Països Catalans in Andorra, Spain, France and Italy', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ceb', 'Cebuano', 'Cebuano', '%s Mga Paghubad sa PULONG_O_HUGPONG SA PAMULONG', 'Mga kahulugan sa %s', 'Mga Kapulong', 'Mga pananglitan:', 'Kitaa pag-usab', 'Austronesian', 'Malayo-Polynesian', 'ceb', 'cebu1242', 'Latn', 'the southern Philippines', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('chr', 'Cherokee', 'ᏣᎳᎩ', None, None, None, None, None, 'Iroquoian', None, 'chr', 'cher1273', 'Cher', 'North America', '', None, None, None, None, None, None, None, None),
+    ('ny', 'Chichewa', 'Nyanja', 'Matanthauzidwe a %s', 'Mamasulidwe a %s', 'Mau ofanana', 'Zitsanzo', 'Onaninso', 'Atlantic-Congo', 'Bantu', 'nya', 'nyan1308', 'Latn', 'Malawi; Zambia', 'google', None, None, 'Chinyanja', None, None, None, None, None),
+    ('lzh', 'Chinese (Literary)', '文言', None, None, None, None, None, 'Sino-Tibetan', 'Sinitic', 'lzh', 'lite1248', 'Hans', 'ancient China', 'bing', '古漢語', None, None, None, None, None, None, None),
+    ('zh-CN', 'Chinese (Simplified)', '简体中文', '%s 的翻译', '%s的定义', '同义词', '示例', '另请参阅', 'Sino-Tibetan', 'Sinitic', 'zho-CN', 'mand1415', 'Hans', 'the Greater China regions', 'google; bing; yandex', None, None, None, 'true', 'mainland China; Singapore', None, None, None),
+    ('zh-TW', 'Chinese (Traditional)', '繁體中文', '「%s」的翻譯', '「%s」的定義', '同義詞', '例句', '另請參閱', 'Sino-Tibetan', 'Sinitic', 'zho-TW', 'mand1415', 'Hant', 'the Greater China regions', 'google; bing', '正體中文', None, None, 'true', 'Taiwan (Republic of China); Hong Kong; Macau', None, None, None),
+    ('cv', 'Chuvash', 'Чӑвашла', None, None, None, None, None, 'Turkic', 'Oghur', 'chv', 'chuv1255', 'Cyrl', 'the Chuvash Republic in Russia', 'yandex', None, None, None, None, None, None, None, None),
+    ('co', 'Corsican', 'Corsu', 'Traductions de %s', 'Définitions de %s', 'Synonymes', 'Exemples', 'Voir aussi', 'Indo-European', 'Italo-Dalmatian', 'cos', 'cors1241', 'Latn', 'Corsica in France; the northern end of the island of Sardinia in Italy', 'google', None, None, None, None, None, None, None, None),
+    ('hr', 'Croatian', 'Hrvatski', 'Prijevodi riječi ili izraza %s', 'Definicije riječi ili izraza %s', 'Sinonimi', 'Primjeri', 'Također pogledajte', 'Indo-European', 'South Slavic', 'hrv', 'croa1245', 'Latn', 'Croatia; Bosnia and Herzegovina', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('cs', 'Czech', 'Čeština', 'Překlad výrazu %s', 'Definice výrazu %s', 'Synonyma', 'Příklady', 'Viz také', 'Indo-European', 'West Slavic', 'ces', 'czec1258', 'Latn', 'Czechia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('da', 'Danish', 'Dansk', 'Oversættelser af %s', 'Definitioner af %s', 'Synonymer', 'Eksempler', 'Se også', 'Indo-European', 'North Germanic', 'dan', 'dani1285', 'Latn', 'Denmark; Greenland; the Faroe Islands; the northern German region of Southern Schleswig', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('prs', 'Dari', 'دری', None, None, None, None, None, 'Indo-European', 'Iranian', 'prs', 'dari1249', 'Arab', 'Afghanistan; Iran', 'bing', None, 'true', None, None, None, None, None, None),
+    ('dv', 'Dhivehi', 'ދިވެހި', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'div', 'dhiv1236', 'Thaa', 'the Maldives', 'google; bing', None, 'true', 'Divehi', None, None, 'Maldivian', None, None),
+    ('doi', 'Dogri', 'डोगरी', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'doi', 'indo1311', 'Deva', 'the Jammu region in northern India', 'google', None, None, None, None, None, None, None, None),
+    ('nl', 'Dutch', 'Nederlands', 'Vertalingen van %s', 'Definities van %s', 'Synoniemen', 'Voorbeelden', 'Zie ook', 'Indo-European', 'West Germanic', 'nld', 'dutc1256', 'Latn', 'the Netherlands; Belgium; Suriname; Aruba; Curaçao; Sint Maarten; the Caribbean Netherlands', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('dz', 'Dzongkha', 'རྫོང་ཁ', None, None, None, None, None, 'Sino-Tibetan', 'Tibetic', 'dzo', 'nucl1307', 'Tibt', 'Bhutan', '', None, None, None, None, None, None, None, None),
+    ('en', 'English', 'English', 'Translations of %s', 'Definitions of %s', 'Synonyms', 'Examples', 'See also', 'Indo-European', 'West Germanic', 'eng', 'stan1293', 'Latn', 'worldwide', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('eo', 'Esperanto', 'Esperanto', 'Tradukoj de %s', 'Difinoj de %s', 'Sinonimoj', 'Ekzemploj', 'Vidu ankaŭ', 'Constructed language', None, 'epo', 'espe1235', 'Latn', 'worldwide', 'google; yandex', None, None, None, None, None, None, "the world's most widely spoken constructed international auxiliary language, designed to be a universal second language for international communication", None),
+    ('et', 'Estonian', 'Eesti', 'Sõna(de) %s tõlked', 'Sõna(de) %s definitsioonid', 'Sünonüümid', 'Näited', 'Vt ka', 'Uralic', 'Finnic', 'est', 'esto1258', 'Latn', 'Estonia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ee', 'Ewe', 'Eʋegbe', None, None, None, None, None, 'Atlantic-Congo', 'Gbe', 'ewe', 'ewee1241', 'Latn', 'Ghana; Togo; Benin', 'google', None, None, None, None, None, None, None, None),
+    ('fo', 'Faroese', 'Føroyskt', None, None, None, None, None, 'Indo-European', 'North Germanic', 'fao', 'faro1244', 'Latn', 'the Faroe Islands', 'bing', None, None, None, None, None, None, None, None),
+    ('fj', 'Fijian', 'Vosa Vakaviti', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'fij', 'fiji1243', 'Latn', 'Fiji', 'bing', None, None, None, None, None, None, None, None),
+    ('tl', 'Filipino', 'Filipino', 'Mga pagsasalin ng %s', 'Mga kahulugan ng %s', 'Mga Kasingkahulugan', 'Mga Halimbawa', 'Tingnan rin ang', 'Austronesian', 'Malayo-Polynesian', 'fil', 'fili1244', 'Latn', 'the Philippines', 'google; bing; yandex', 'Tagalog', None, 'Tagalog', None, None, None, None, None),
+    ('fi', 'Finnish', 'Suomi', 'Käännökset tekstille %s', 'Määritelmät kohteelle %s', 'Synonyymit', 'Esimerkkejä', 'Katso myös', 'Uralic', 'Finnic', 'fin', 'finn1318', 'Latn', 'Finland', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('fr', 'French', 'Français', 'Traductions de %s', 'Définitions de %s', 'Synonymes', 'Exemples', 'Voir aussi', 'Indo-European', 'Western Romance', 'fra', 'stan1290', 'Latn', 'France; Switzerland; Belgium; Luxembourg', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('fr-CA', 'French (Canadian)', 'Français canadien', 'Traductions de %s', 'Définitions de %s', 'Synonymes', 'Exemples', 'Voir aussi', 'Indo-European', 'Western Romance', 'fra-CA', 'queb1247', 'Latn', 'Canada', 'bing', None, None, None, None, None, None, None, None),
+    ('gl', 'Galician', 'Galego', 'Traducións de %s', 'Definicións de %s', 'Sinónimos', 'Exemplos', 'Ver tamén', 'Indo-European', 'Western Romance', 'glg', 'gali1258', 'Latn', 'Galicia in northwestern Spain', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ka', 'Georgian', 'ქართული', '%s-ის თარგმანები', '%s-ის განსაზღვრებები', 'სინონიმები', 'მაგალითები', 'ასევე იხილეთ', 'Kartvelian', 'Karto-Zan', 'kat', 'nucl1302', 'Geor', 'Georgia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('de', 'German', 'Deutsch', 'Übersetzungen für %s', 'Definitionen von %s', 'Synonyme', 'Beispiele', 'Siehe auch', 'Indo-European', 'West Germanic', 'deu', 'stan1295', 'Latn', 'Central Europe', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('el', 'Greek', 'Ελληνικά', 'Μεταφράσεις του %s', 'Όρισμοί %s', 'Συνώνυμα', 'Παραδείγματα', 'Δείτε επίσης', 'Indo-European', 'Paleo-Balkan', 'ell', 'mode1248', 'Grek', 'Greece; Cyprus; southern Albania', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('kl', 'Greenlandic', 'Kalaallisut', None, None, None, None, None, 'Eskimo-Aleut', 'Inuit', 'kal', 'kala1399', 'Latn', 'Greenland', '', None, None, None, None, None, None, None, None),
+    ('gn', 'Guarani', "Avañe'ẽ", None, None, None, None, None, 'Tupian', None, 'gug', 'para1311', 'Latn', 'Paraguay; Bolivia; Argentina; Brazil', 'google', None, None, None, None, None, None, None, None),
+    ('gu', 'Gujarati', 'ગુજરાતી', '%s ના અનુવાદ', '%s ની વ્યાખ્યાઓ', 'સમાનાર્થી', 'ઉદાહરણો', 'આ પણ જુઓ', 'Indo-European', 'Indo-Aryan', 'guj', 'guja1252', 'Gujr', 'the Indian state of Gujarat', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ht', 'Haitian Creole', 'Kreyòl Ayisyen', 'Tradiksyon %s', 'Definisyon nan %s', 'Sinonim', 'Egzanp:', 'Wè tou', 'Indo-European', 'French Creole', 'hat', 'hait1244', 'Latn', 'Haiti', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('haw', 'Hawaiian', 'ʻŌlelo Hawaiʻi', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'haw', 'hawa1245', 'Latn', 'the US state of Hawaii', 'google', None, None, None, None, None, None, None, None),
+    ('ha', 'Hausa', 'Hausa', 'Fassarar %s', "Ma'anoni na %s", "Masu kamancin ma'ana", 'Misalai', 'Duba kuma', 'Afro-Asiatic', 'Chadic', 'hau', 'haus1257', 'Latn', 'Chad; Nigeria; Niger; Ghana; Cameroon; Benin', 'google', None, None, None, None, None, None, None, None),
+    ('he', 'Hebrew', 'עִבְרִית', 'תרגומים של %s', 'הגדרות של %s', 'מילים נרדפות', 'דוגמאות', 'ראה גם', 'Afro-Asiatic', 'Semitic', 'heb', 'hebr1245', 'Hebr', 'Israel', 'google; bing; yandex', None, 'true', None, None, None, None, None, None),
+    ('mrj', 'Hill Mari', 'Кырык мары', None, None, None, None, None, 'Uralic', 'Mari', 'mrj', 'west2392', 'Cyrl', 'the Gornomariysky, Yurinsky and Kilemarsky districts of Mari El, Russia', 'yandex', None, None, None, None, None, None, None, None),
+    ('hi', 'Hindi', 'हिन्दी', '%s के अनुवाद', '%s की परिभाषाएं', 'समानार्थी', 'उदाहरण', 'यह भी देखें', 'Indo-European', 'Indo-Aryan', 'hin', 'hind1269', 'Deva', 'India', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('hmn', 'Hmong', 'Hmoob', 'Lus txhais: %s', None, None, None, None, 'Hmong-Mien', 'Hmongic', 'hmn', 'firs1234', 'Latn', 'China; Vietnam; Laos; Myanmar; Thailand', 'google; bing', None, None, None, None, None, None, None, None),
+    ('hu', 'Hungarian', 'Magyar', '%s fordításai', '%s jelentései', 'Szinonimák', 'Példák', 'Lásd még', 'Uralic', 'Ugric', 'hun', 'hung1274', 'Latn', 'Hungary', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('is', 'Icelandic', 'Íslenska', 'Þýðingar á %s', 'Skilgreiningar á', 'Samheiti', 'Dæmi', 'Sjá einnig', 'Indo-European', 'North Germanic', 'isl', 'icel1247', 'Latn', 'Iceland', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ig', 'Igbo', 'Igbo', 'Ntụgharị asụsụ nke %s', 'Nkọwapụta nke %s', 'Okwu oyiri', 'Ọmụmaatụ', 'Hụkwuo', 'Atlantic-Congo', 'Igboid', 'ibo', 'nucl1417', 'Latn', 'southeastern Nigeria', 'google', None, None, None, None, None, None, None, None),
+    ('ilo', 'Ilocano', 'Ilokano', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'ilo', 'ilok1237', 'Latn', 'the northern Philippines', 'google', None, None, None, None, None, None, None, None),
+    ('id', 'Indonesian', 'Bahasa Indonesia', 'Terjemahan dari %s', 'Definisi %s', 'Sinonim', 'Contoh', 'Lihat juga', 'Austronesian', 'Malayo-Polynesian', 'ind', 'indo1316', 'Latn', 'Indonesia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ie', 'Interlingue', 'Interlingue', None, None, None, None, None, 'Constructed language', None, 'ile', 'occi1241', 'Latn', 'worldwide', '', None, None, 'Occidental', None, None, None, 'an international auxiliary language', None),
+    ('ikt', 'Inuinnaqtun', 'Inuinnaqtun', None, None, None, None, None, 'Eskimo-Aleut', 'Inuit', 'ikt', 'copp1244', 'Latn', 'the Canadian Arctic', 'bing', None, None, None, None, None, None, None, None),
+    ('iu', 'Inuktitut', 'ᐃᓄᒃᑎᑐᑦ', None, None, None, None, None, 'Eskimo-Aleut', 'Inuit', 'iku', 'east2534', 'Cans', 'the Canadian Arctic', 'bing', None, None, None, None, None, None, None, None),
+    ('iu-Latn', 'Inuktitut (Latin)', 'Inuktitut', None, None, None, None, None, 'Eskimo-Aleut', 'Inuit', 'iku', 'east2534', 'Latn', 'the Canadian Arctic', 'bing', None, None, None, None, None, None, None, None),
+    ('ga', 'Irish', 'Gaeilge', 'Aistriúcháin ar %s', 'Sainmhínithe ar %s', 'Comhchiallaigh', 'Samplaí', 'féach freisin', 'Indo-European', 'Celtic', 'gle', 'iris1253', 'Latn', 'Ireland', 'google; bing; yandex', None, None, 'Gaelic', None, None, None, None, None),
+    ('it', 'Italian', 'Italiano', 'Traduzioni di %s', 'Definizioni di %s', 'Sinonimi', 'Esempi', 'Vedi anche', 'Indo-European', 'Italo-Dalmatian', 'ita', 'ital1282', 'Latn', 'Italy; Switzerland; San Marino; Vatican City', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('ja', 'Japanese', '日本語', '「%s」の翻訳', '%s の定義', '同義語', '例', '関連項目', 'Japonic', None, 'jpn', 'nucl1643', 'Jpan', 'Japan', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('jv', 'Javanese', 'Basa Jawa', 'Terjemahan %s', 'Arti %s', 'Sinonim', 'Conto', 'Deleng uga', 'Austronesian', 'Malayo-Polynesian', 'jav', 'java1254', 'Latn', 'Java, Indonesia', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('kn', 'Kannada', 'ಕನ್ನಡ', '%s ನ ಅನುವಾದಗಳು', '%s ನ ವ್ಯಾಖ್ಯಾನಗಳು', 'ಸಮಾನಾರ್ಥಕಗಳು', 'ಉದಾಹರಣೆಗಳು', 'ಇದನ್ನೂ ಗಮನಿಸಿ', 'Dravidian', 'South Dravidian', 'kan', 'nucl1305', 'Knda', 'the southwestern India', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('kk', 'Kazakh', 'Қазақ тілі', '%s аудармалары', '%s анықтамалары', 'Синонимдер', 'Мысалдар', 'Келесі тізімді де көріңіз:', 'Turkic', 'Kipchak', 'kaz', 'kaza1248', 'Cyrl', 'Kazakhstan; China; Mongolia; Russia; Kyrgyzstan; Uzbekistan', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('km', 'Khmer', 'ភាសាខ្មែរ', 'ការ\u200bបក\u200bប្រែ\u200bនៃ %s', 'និយមន័យ\u200bនៃ\u200b %s', 'សទិសន័យ', 'ឧទាហរណ៍', 'មើល\u200bផង\u200bដែរ', 'Austroasiatic', 'Khmeric', 'khm', 'cent1989', 'Khmr', 'Cambodia; Thailand; Vietnam', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('rw', 'Kinyarwanda', 'Ikinyarwanda', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'kin', 'kiny1244', 'Latn', 'Rwanda; Uganda; DR Congo; Tanzania', 'google', None, None, None, None, None, None, None, None),
+    ('tlh-Latn', 'Klingon', 'tlhIngan Hol', None, None, None, None, None, 'Constructed language', None, 'tlh-Latn', 'klin1234', 'Latn', 'the Star Trek universe', 'bing', None, None, None, None, None, None, 'a fictional language spoken by the Klingons in the Star Trek universe', None),
+    ('gom', 'Konkani', 'कोंकणी', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'gom', 'goan1235', 'Deva', 'the western coastal region of India', 'google', None, None, None, None, None, None, None, None),
+    ('ko', 'Korean', '한국어', '%s의 번역', '%s의 정의', '동의어', '예문', '참조', 'Koreanic', None, 'kor', 'kore1280', 'Kore', 'South Korea; North Korea; China', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('kri', 'Krio', 'Krio', None, None, None, None, None, 'Indo-European', 'English Creole', 'kri', 'krio1253', 'Latn', 'Sierra Leone', 'google', None, None, None, None, None, None, None, None),
+    ('ku', 'Kurdish (Northern)', 'Kurmancî', None, None, None, None, None, 'Indo-European', 'Iranian', 'kmr', 'nort2641', 'Latn', 'southeast Turkey; northwest and northeast Iran; northern Iraq; northern Syria; the Caucasus and Khorasan regions', 'google', 'Kurdî', None, 'Kurmanji', None, None, None, None, None),
+    ('ckb', 'Kurdish (Central)', 'سۆرانی', None, None, None, None, None, 'Indo-European', 'Iranian', 'ckb', 'cent1972', 'Arab', 'Iraqi Kurdistan; western Iran', 'google', 'کوردیی ناوەندی', 'true', 'Sorani', None, None, None, None, None),
+    ('ky', 'Kyrgyz', 'Кыргызча', '%s котормосу', '%s аныктамасы', 'Синонимдер', 'Мисалдар', 'Дагы караңыз', 'Turkic', 'Kipchak', 'kir', 'kirg1245', 'Cyrl', 'Kyrgyzstan; China; Tajikistan; Afghanistan; Pakistan', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('lo', 'Lao', 'ລາວ', 'ຄຳ\u200bແປ\u200bສຳລັບ %s', 'ຄວາມໝາຍຂອງ %s', 'ຄຳທີ່ຄ້າຍກັນ %s', 'ຕົວຢ່າງ', 'ເບິ່ງ\u200bເພີ່ມ\u200bເຕີມ', 'Kra-Dai', 'Tai', 'lao', 'laoo1244', 'Laoo', 'Laos; Thailand; Cambodia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('la', 'Latin', 'Latina', 'Versio de %s', None, None, None, None, 'Indo-European', 'Latino-Faliscan', 'lat', 'lati1261', 'Latn', 'ancient Rome', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('lv', 'Latvian', 'Latviešu', '%s tulkojumi', '%s definīcijas', 'Sinonīmi', 'Piemēri', 'Skatiet arī', 'Indo-European', 'Eastern Baltic', 'lav', 'latv1249', 'Latn', 'Latvia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ln', 'Lingala', 'Lingála', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'lin', 'ling1269', 'Latn', 'DR Congo; Republic of the Congo; Angola; Central African Republic; southern South Sudan', 'google', None, None, None, None, None, None, None, None),
+    ('lt', 'Lithuanian', 'Lietuvių', '„%s“ vertimai', '„%s“ apibrėžimai', 'Sinonimai', 'Pavyzdžiai', 'Taip pat žiūrėkite', 'Indo-European', 'Eastern Baltic', 'lit', 'lith1251', 'Latn', 'Lithuania', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('lg', 'Luganda', 'Luganda', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'lug', 'gand1255', 'Latn', 'Uganda; Rwanda', 'google', 'Oluganda', None, None, None, None, None, None, None),
+    ('lb', 'Luxembourgish', 'Lëtzebuergesch', None, None, None, None, None, 'Indo-European', 'West Germanic', 'ltz', 'luxe1241', 'Latn', 'Luxembourg', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('mk', 'Macedonian', 'Македонски', 'Преводи на %s', 'Дефиниции на %s', 'Синоними', 'Примери', 'Види и', 'Indo-European', 'South Slavic', 'mkd', 'mace1250', 'Cyrl', 'North Macedonia; Albania; Bosnia and Herzegovina; Romania; Serbia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mai', 'Maithili', 'मैथिली', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'mai', 'mait1250', 'Deva', 'the Mithila region in India and Nepal', 'google', None, None, None, None, None, None, None, None),
+    ('mg', 'Malagasy', 'Malagasy', "Dikan'ny %s", 'Famaritana ny %s', 'Mitovy hevitra', 'Ohatra', 'Jereo ihany koa', 'Austronesian', 'Malayo-Polynesian', 'mlg', 'plat1254', 'Latn', 'Madagascar; the Comoros; Mayotte', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ms', 'Malay', 'Bahasa Melayu', 'Terjemahan %s', 'Takrif %s', 'Sinonim', 'Contoh', 'Lihat juga', 'Austronesian', 'Malayo-Polynesian', 'msa', 'stan1306', 'Latn', 'Malaysia; Singapore; Indonesia; Brunei; East Timor', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ml', 'Malayalam', 'മലയാളം', '%s എന്നതിന്റെ വിവർത്തനങ്ങൾ', '%s എന്നതിന്റെ നിർവ്വചനങ്ങൾ', 'പര്യായങ്ങള്\u200d', 'ഉദാഹരണങ്ങള്\u200d', 'ഇതും കാണുക', 'Dravidian', 'South Dravidian', 'mal', 'mala1464', 'Mlym', 'Kerala, Lakshadweep and Puducherry in India', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mt', 'Maltese', 'Malti', "Traduzzjonijiet ta' %s", "Definizzjonijiet ta' %s", 'Sinonimi', 'Eżempji', 'Ara wkoll', 'Afro-Asiatic', 'Semitic', 'mlt', 'malt1254', 'Latn', 'Malta', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mi', 'Maori', 'Māori', 'Ngā whakamāoritanga o %s', 'Ngā whakamārama o %s', 'Ngā Kupu Taurite', 'Ngā Tauira:', 'Tiro hoki:', 'Austronesian', 'Malayo-Polynesian', 'mri', 'maor1246', 'Latn', 'New Zealand', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mr', 'Marathi', 'मराठी', '%s ची भाषांतरे', '%s च्या व्याख्या', 'समानार्थी शब्द', 'उदाहरणे', 'हे देखील पहा', 'Indo-European', 'Indo-Aryan', 'mar', 'mara1378', 'Deva', 'the Indian state of Maharashtra', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mhr', 'Eastern Mari', 'Олык марий', None, None, None, None, None, 'Uralic', 'Mari', 'mhr', 'east2328', 'Cyrl', 'Mari El, Russia', 'yandex', None, None, 'Meadow Mari', None, None, None, None, None),
+    ('mni-Mtei', 'Meiteilon', 'ꯃꯤꯇꯩꯂꯣꯟ', None, None, None, None, None, 'Sino-Tibetan', 'Tibeto-Burman', 'mni', 'mani1292', 'Mtei', 'the northeastern India; Bangladesh; Myanmar', 'google', None, None, 'Manipuri', None, None, 'Meitei', None, 'Meetei'),
+    ('lus', 'Mizo', 'Mizo ṭawng', None, None, None, None, None, 'Sino-Tibetan', 'Tibeto-Burman', 'lus', 'lush1249', 'Latn', 'the Indian state of Mizoram', 'google', None, None, None, None, None, None, None, None),
+    ('mn', 'Mongolian', 'Монгол', '%s-н орчуулга', '%s үгийн тодорхойлолт', 'Ойролцоо утгатай', 'Жишээнүүд', 'Мөн харах', 'Mongolic', None, 'mon', 'mong1331', 'Cyrl', 'Mongolia; Inner Mongolia in China', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('mn-Mong', 'Mongolian (Traditional)', 'ᠮᠣᠩᠭᠣᠯ', None, None, None, None, None, 'Mongolic', None, 'mon-Mong', 'mong1331', 'Mong', 'Mongolia; Inner Mongolia in China', 'bing', None, None, None, None, None, None, None, None),
+    ('my', 'Myanmar', 'မြန်မာစာ', '%s၏ ဘာသာပြန်ဆိုချက်များ', '%s၏ အနက်ဖွင့်ဆိုချက်များ', 'ကြောင်းတူသံကွဲများ', 'ဥပမာ', 'ဖော်ပြပါများကိုလဲ ကြည့်ပါ', 'Sino-Tibetan', 'Tibeto-Burman', 'mya', 'nucl1310', 'Mymr', 'Myanmar', 'google; bing; yandex', None, None, 'Burmese', None, None, None, None, None),
+    ('ne', 'Nepali', 'नेपाली', '%sका अनुवाद', '%sको परिभाषा', 'समानार्थीहरू', 'उदाहरणहरु', 'यो पनि हेर्नुहोस्', 'Indo-European', 'Indo-Aryan', 'nep', 'nepa1254', 'Deva', 'Nepal; India', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('no', 'Norwegian', 'Norsk', 'Oversettelser av %s', 'Definisjoner av %s', 'Synonymer', 'Eksempler', 'Se også', 'Indo-European', 'North Germanic', 'nor', 'norw1258', 'Latn', 'Norway', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('oc', 'Occitan', 'Occitan', None, None, None, None, None, 'Indo-European', 'Western Romance', 'oci', 'occi1239', 'Latn', 'Occitania in France, Monaco, Italy and Spain', '', None, None, None, None, None, None, None, None),
+    ('or', 'Odia', 'ଓଡ଼ିଆ', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'ori', 'macr1269', 'Orya', 'the Indian state of Odisha', 'google; bing', None, None, 'Oriya', None, None, None, None, None),
+    ('om', 'Oromo', 'Afaan Oromoo', None, None, None, None, None, 'Afro-Asiatic', 'Cushitic', 'orm', 'nucl1736', 'Latn', 'the Ethiopian state of Oromia; northeastern Kenya', 'google', None, None, None, None, None, None, None, None),
+    ('pap', 'Papiamento', 'Papiamentu', None, None, None, None, None, 'Indo-European', 'Portuguese Creole', 'pap', 'papi1253', 'Latn', 'the Dutch Caribbean', 'yandex', None, None, None, None, None, None, None, None),
+    ('ps', 'Pashto', 'پښتو', 'د %sژباړې', 'د%s تعریفونه', 'مترادف لغتونه', 'بېلګې', 'دا هم ووینئ', 'Indo-European', 'Iranian', 'pus', 'pash1269', 'Arab', 'Afghanistan; Pakistan', 'google; bing', None, 'true', 'Pushto', None, None, None, None, None),
+    ('fa', 'Persian', 'فارسی', 'ترجمه\u200cهای %s', 'تعریف\u200cهای %s', 'مترادف\u200cها', 'مثال\u200cها', 'همچنین مراجعه کنید به', 'Indo-European', 'Iranian', 'fas', 'west2369', 'Arab', 'Iran', 'google; bing; yandex', None, 'true', 'Farsi', None, None, None, None, None),
+    ('pl', 'Polish', 'Polski', 'Tłumaczenia %s', '%s – definicje', 'Synonimy', 'Przykłady', 'Zobacz też', 'Indo-European', 'West Slavic', 'pol', 'poli1260', 'Latn', 'Poland', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('pt-BR', 'Portuguese (Brazilian)', 'Português Brasileiro', 'Traduções de %s', 'Definições de %s', 'Sinônimos', 'Exemplos', 'Veja também', 'Indo-European', 'Western Romance', 'por', 'braz1246', 'Latn', 'Portugal; Brazil; Cape Verde; Angola; Mozambique; Guinea-Bissau; Equatorial Guinea; São Tomé and Príncipe; East Timor; Macau', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('pt-PT', 'Portuguese (European)', 'Português Europeu', 'Traduções de %s', 'Definições de %s', 'Sinônimos', 'Exemplos', 'Veja também', 'Indo-European', 'Western Romance', 'por', 'port1283', 'Latn', 'Portugal; Brazil; Cape Verde; Angola; Mozambique; Guinea-Bissau; Equatorial Guinea; São Tomé and Príncipe; East Timor; Macau', 'bing', None, None, None, None, None, None, None, None),
+    ('pa', 'Punjabi', 'ਪੰਜਾਬੀ', 'ਦੇ ਅਨੁਵਾਦ%s', 'ਦੀਆਂ ਪਰਿਭਾਸ਼ਾ %s', 'ਸਮਾਨਾਰਥਕ ਸ਼ਬਦ', 'ਉਦਾਹਰਣਾਂ', 'ਇਹ ਵੀ ਵੇਖੋ', 'Indo-European', 'Indo-Aryan', 'pan', 'panj1256', 'Guru', 'the Punjab region of India and Pakistan', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('qu', 'Quechua', 'Runasimi', None, None, None, None, None, 'Quechuan', None, 'que', 'quec1387', 'Latn', 'Peru; Bolivia; Ecuador; surrounding countries', 'google', None, None, None, None, None, None, None, None),
+    ('otq', 'Querétaro Otomi', 'Hñąñho', None, None, None, None, None, 'Oto-Manguean', None, 'otq', 'quer1236', 'Latn', 'Querétaro in Mexico', 'bing', None, None, None, None, None, None, None, None),
+    ('ro', 'Romanian', 'Română', 'Traduceri pentru %s', 'Definiții pentru %s', 'Sinonime', 'Exemple', 'Vedeți și', 'Indo-European', 'Eastern Romance', 'ron', 'roma1327', 'Latn', 'Romania; Moldova', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('rm', 'Romansh', 'Rumantsch', None, None, None, None, None, 'Indo-European', 'Western Romance', 'roh', 'roma1326', 'Latn', 'the Swiss canton of the Grisons', '', None, None, None, None, None, None, None, None),
+    ('ru', 'Russian', 'Русский', '%s: варианты перевода', '%s – определения', 'Синонимы', 'Примеры', 'Похожие слова', 'Indo-European', 'East Slavic', 'rus', 'russ1263', 'Cyrl', 'the Russian-speaking world', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('sm', 'Samoan', 'Gagana Sāmoa', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'smo', 'samo1305', 'Latn', 'the Samoan Islands', 'google; bing', None, None, None, None, None, None, None, None),
+    ('sa', 'Sanskrit', 'संस्कृतम्', None, None, None, None, None, 'Indo-European', 'Indo-Aryan', 'san', 'sans1269', 'Deva', 'ancient India', 'google', None, None, None, None, None, None, None, None),
+    ('gd', 'Scots Gaelic', 'Gàidhlig', 'Eadar-theangachadh airson %s', 'Deifiniseanan airson %s', 'Co-fhaclan', 'Buill-eisimpleir', 'Faic na leanas cuideachd', 'Indo-European', 'Celtic', 'gla', 'scot1245', 'Latn', 'Scotland', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('nso', 'Sepedi', 'Sepedi', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'nso', 'nort3233', 'Latn', 'the northeastern provinces of South Africa', 'google', None, None, 'Pedi', None, None, 'Northern Sotho', None, None),
+    ('sr-Cyrl', 'Serbian (Cyrillic)', 'Српски', 'Преводи за „%s“', 'Дефиниције за %s', 'Синоними', 'Примери', 'Погледајте такође', 'Indo-European', 'South Slavic', 'srp-Cyrl', 'serb1264', 'Cyrl', 'Serbia; Bosnia and Herzegovina; Montenegro; Kosovo', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('sr-Latn', 'Serbian (Latin)', 'Srpski', 'Prevodi za „%s“', 'Definicije za %s', 'Sinonimi', 'Primeri', 'Pogledajte takođe', 'Indo-European', 'South Slavic', 'srp-Latn', 'serb1264', 'Latn', 'Serbia; Bosnia and Herzegovina; Montenegro; Kosovo', 'bing', None, None, None, None, None, None, None, None),
+    ('st', 'Sesotho', 'Sesotho', 'Liphetolelo tsa %s', 'Meelelo ea %s', 'Mantsoe a tšoanang ka moelelo', 'Mehlala', 'Bona hape', 'Atlantic-Congo', 'Bantu', 'sot', 'sout2807', 'Latn', 'Lesotho; South Africa; Zimbabwe', 'google', None, None, 'Sotho', None, None, 'Southern Sotho', None, None),
+    ('tn', 'Setswana', 'Setswana', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'tsn', 'tswa1253', 'Latn', 'Botswana; South Africa', '', None, None, 'Tswana', None, None, None, None, None),
+    ('sn', 'Shona', 'chiShona', 'Shanduro dze %s', 'Zvinoreva %s', 'Mashoko anoreva zvakafana nemamwe', 'Mienzaniso', 'Onawo', 'Atlantic-Congo', 'Bantu', 'sna', 'core1255', 'Latn', 'Zimbabwe', 'google', None, None, None, None, None, None, None, None),
+    ('sd', 'Sindhi', 'سنڌي', '%s جو ترجمو', '%s جون وصفون', 'هم معني', 'مثالون', 'به ڏسو', 'Indo-European', 'Indo-Aryan', 'snd', 'sind1272', 'Arab', 'the region of Sindh in Pakistan; India', 'google', None, 'true', None, None, None, None, None, None),
+    ('si', 'Sinhala', 'සිංහල', '%s හි පරිවර්තන', '%s හි නිර්වචන', 'සමානාර්ථ පද', 'උදාහරණ', 'මෙයත් බලන්න', 'Indo-European', 'Indo-Aryan', 'sin', 'sinh1246', 'Sinh', 'Sri Lanka', 'google; yandex', None, None, 'Sinhalese', None, None, None, None, None),
+    ('sk', 'Slovak', 'Slovenčina', 'Preklady výrazu: %s', 'Definície výrazu %s', 'Synonymá', 'Príklady', 'Pozrite tiež', 'Indo-European', 'West Slavic', 'slk', 'slov1269', 'Latn', 'Slovakia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('sl', 'Slovenian', 'Slovenščina', 'Prevodi za %s', 'Razlage za %s', 'Sopomenke', 'Primeri', 'Glejte tudi', 'Indo-European', 'South Slavic', 'slv', 'slov1268', 'Latn', 'Slovenia', 'google; bing; yandex', None, None, 'Slovene', None, None, None, None, None),
+    ('so', 'Somali', 'Soomaali', 'Turjumaada %s', 'Qeexitaannada %s', 'La micne ah', 'Tusaalooyin', 'Sidoo kale eeg', 'Afro-Asiatic', 'Cushitic', 'som', 'soma1255', 'Latn', 'Somalia; Somaliland; Ethiopia; Djibouti', 'google; bing', None, None, None, None, None, None, None, None),
+    ('es', 'Spanish', 'Español', 'Traducciones de %s', 'Definiciones de %s', 'Sinónimos', 'Ejemplos', 'Ver también', 'Indo-European', 'Western Romance', 'spa', 'stan1288', 'Latn', 'Spain; the Americas', 'google; bing; yandex', None, None, None, 'true', None, None, None, None),
+    ('su', 'Sundanese', 'Basa Sunda', 'Tarjamahan tina %s', 'Panjelasan tina %s', 'Sinonim', 'Conto', 'Tingali ogé', 'Austronesian', 'Malayo-Polynesian', 'sun', 'sund1252', 'Latn', 'Java, Indonesia', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('sw', 'Swahili', 'Kiswahili', 'Tafsiri ya %s', 'Ufafanuzi wa %s', 'Visawe', 'Mifano', 'Angalia pia', 'Atlantic-Congo', 'Bantu', 'swa', 'swah1253', 'Latn', 'the East African coast and litoral islands', 'google; bing; yandex', None, None, 'Kiswahili', None, None, None, None, None),
+    ('sv', 'Swedish', 'Svenska', 'Översättningar av %s', 'Definitioner av %s', 'Synonymer', 'Exempel', 'Se även', 'Indo-European', 'North Germanic', 'swe', 'swed1254', 'Latn', 'Sweden; Finland; Estonia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('ty', 'Tahitian', 'Reo Tahiti', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'tah', 'tahi1242', 'Latn', 'French Polynesia', 'bing', None, None, None, None, None, None, None, None),
+    ('tg', 'Tajik', 'Тоҷикӣ', 'Тарҷумаҳои %s', 'Таърифҳои %s', 'Муродифҳо', 'Намунаҳо:', 'Ҳамчунин Бинед', 'Indo-European', 'Iranian', 'tgk', 'taji1245', 'Cyrl', 'Tajikistan; Uzbekistan', 'google; yandex', None, None, 'Tajiki', None, None, None, None, None),
+    ('ta', 'Tamil', 'தமிழ்', '%s இன் மொழிபெயர்ப்புகள்', '%s இன் வரையறைகள்', 'இணைச்சொற்கள்', 'எடுத்துக்காட்டுகள்', 'இதையும் காண்க', 'Dravidian', 'South Dravidian', 'tam', 'tami1289', 'Taml', 'the Indian state of Tamil Nadu; Sri Lanka; Singapore', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('tt', 'Tatar', 'татарча', None, None, None, None, None, 'Turkic', 'Kipchak', 'tat', 'tata1255', 'Cyrl', 'the Republic of Tatarstan in Russia', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('te', 'Telugu', 'తెలుగు', '%s యొక్క అనువాదాలు', '%s యొక్క నిర్వచనాలు', 'పర్యాయపదాలు', 'ఉదాహరణలు', 'వీటిని కూడా చూడండి', 'Dravidian', 'South-Central Dravidian', 'tel', 'telu1262', 'Telu', 'the Indian states of Andhra Pradesh and Telangana', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('th', 'Thai', 'ไทย', 'คำแปลของ %s', 'คำจำกัดความของ %s', 'คำพ้องความหมาย', 'ตัวอย่าง', 'ดูเพิ่มเติม', 'Kra-Dai', 'Tai', 'tha', 'thai1261', 'Thai', 'Thailand', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('bo', 'Tibetan', 'བོད་ཡིག', None, None, None, None, None, 'Sino-Tibetan', 'Tibetic', 'bod', 'tibe1272', 'Tibt', 'the Tibet Autonomous Region of China', 'bing', None, None, None, None, None, None, None, None),
+    ('ti', 'Tigrinya', 'ትግርኛ', None, None, None, None, None, 'Afro-Asiatic', 'Semitic', 'tir', 'tigr1271', 'Ethi', 'Eritrea; the Tigray region of northern Ethiopia', 'google; bing', None, None, None, None, None, None, None, None),
+    ('to', 'Tongan', 'Lea faka-Tonga', None, None, None, None, None, 'Austronesian', 'Malayo-Polynesian', 'ton', 'tong1325', 'Latn', 'Tonga', 'bing', None, None, None, None, None, None, None, None),
+    ('ts', 'Tsonga', 'Xitsonga', None, None, None, None, None, 'Atlantic-Congo', 'Bantu', 'tso', 'tson1249', 'Latn', 'Eswatini; Mozambique; South Africa; Zimbabwe', 'google', None, None, None, None, None, None, None, None),
+    ('tr', 'Turkish', 'Türkçe', '%s çevirileri', '%s için tanımlar', 'Eş anlamlılar', 'Örnekler', 'Ayrıca bkz.', 'Turkic', 'Oghuz', 'tur', 'nucl1301', 'Latn', 'Türkiye; Cyprus', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('tk', 'Turkmen', 'Türkmen', None, None, None, None, None, 'Turkic', 'Oghuz', 'tuk', 'turk1304', 'Latn', 'Turkmenistan; Iran; Afghanistan; Pakistan', 'google; bing', None, None, None, None, None, None, None, None),
+    ('tw', 'Twi', 'Twi', None, None, None, None, None, 'Atlantic-Congo', 'Kwa', 'twi', 'akua1239', 'Latn', 'Ghana', 'google', None, None, 'Akan Kasa', None, None, None, None, None),
+    ('udm', 'Udmurt', 'Удмурт', None, None, None, None, None, 'Uralic', 'Permic', 'udm', 'udmu1245', 'Cyrl', 'the Republic of Udmurt in Russia', 'yandex', None, None, None, None, None, None, None, None),
+    ('uk', 'Ukrainian', 'Українська', "Переклади слова або виразу '%s'", "'%s' – визначення", 'Синоніми', 'Приклади', 'Дивіться також', 'Indo-European', 'East Slavic', 'ukr', 'ukra1253', 'Cyrl', 'Ukraine', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('hsb', 'Upper Sorbian', 'Hornjoserbšćina', None, None, None, None, None, 'Indo-European', 'West Slavic', 'hsb', 'uppe1395', 'Latn', 'Saxony, Germany', 'bing', None, None, None, None, None, None, None, None),
+    ('ur', 'Urdu', 'اُردُو', 'کے ترجمے %s', 'کی تعریفات %s', 'مترادفات', 'مثالیں', 'نیز دیکھیں', 'Indo-European', 'Indo-Aryan', 'urd', 'urdu1245', 'Arab', 'Pakistan; India', 'google; bing; yandex', None, 'true', None, None, None, None, None, None),
+    ('ug', 'Uyghur', 'ئۇيغۇر تىلى', None, None, None, None, None, 'Turkic', 'Karluk', 'uig', 'uigh1240', 'Arab', 'the Xinjiang Uyghur Autonomous Region of China', 'google; bing', None, 'true', None, None, None, None, None, None),
+    ('uz', 'Uzbek', 'Oʻzbek tili', '%s: tarjima variantlari', '%s – ta’riflar', 'Sinonimlar', 'Namunalar', 'O‘xshash so‘zlar', 'Turkic', 'Karluk', 'uzb', 'uzbe1247', 'Latn', 'Uzbekistan; Afghanistan; Pakistan', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('vi', 'Vietnamese', 'Tiếng Việt', 'Bản dịch của %s', 'Nghĩa của %s', 'Từ đồng nghĩa', 'Ví dụ', 'Xem thêm', 'Austroasiatic', 'Vietic', 'vie', 'viet1252', 'Latn', 'Vietnam', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('vo', 'Volapük', 'Volapük', None, None, None, None, None, 'Constructed language', None, 'vol', 'vola1234', 'Latn', 'worldwide', '', None, None, None, None, None, None, 'an international auxiliary language', None),
+    ('cy', 'Welsh', 'Cymraeg', 'Cyfieithiadau %s', 'Diffiniadau %s', 'Cyfystyron', 'Enghreifftiau', 'Gweler hefyd', 'Indo-European', 'Celtic', 'cym', 'wels1247', 'Latn', 'Wales in the UK', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+    ('fy', 'Frisian', 'Frysk', 'Oersettings fan %s', 'Definysjes fan %s', 'Synonimen', 'Foarbylden', 'Sjoch ek', 'Indo-European', 'West Germanic', 'fry', 'west2354', 'Latn', 'Friesland in the Netherlands', 'google', None, None, None, None, None, None, None, None),
+    ('wo', 'Wolof', 'Wollof', None, None, None, None, None, 'Atlantic-Congo', 'Atlantic', 'wol', 'wolo1247', 'Latn', 'Senegal; Mauritania; the Gambia', '', None, None, None, None, None, None, None, None),
+    ('xh', 'Xhosa', 'isiXhosa', 'Iinguqulelo zika-%s', 'Iingcaciso zika-%s', 'Izithethantonye', 'Imizekelo', 'Kwakhona bona', 'Atlantic-Congo', 'Bantu', 'xho', 'xhos1239', 'Latn', 'South Africa; Zimbabwe', 'google; yandex', None, None, None, None, None, None, None, None),
+    ('sah', 'Yakut', 'Sakha', None, None, None, None, None, 'Turkic', 'Siberian Turkic', 'sah', 'yaku1245', 'Latn', 'the Republic of Sakha (Yakutia) in Russia', 'yandex', None, None, 'Sakha', None, None, None, None, None),
+    ('yi', 'Yiddish', 'ייִדיש', 'איבערזעצונגען פון %s', 'דפיניציונען %s', 'סינאָנימען', 'ביישפילע', 'זייען אויך', 'Indo-European', 'West Germanic', 'yid', 'yidd1255', 'Hebr', 'worldwide', 'google; yandex', None, 'true', None, None, None, None, 'a West Germanic language historically spoken by Ashkenazi Jews', None),
+    ('yo', 'Yoruba', 'Yorùbá', 'Awọn itumọ ti %s', 'Awọn itumọ ti %s', 'Awọn ọrọ onitumọ', 'Awọn apẹrẹ', 'Tun wo', 'Atlantic-Congo', None, 'yor', 'yoru1245', 'Latn', 'Nigeria; Benin', 'google', None, None, None, None, None, None, None, None),
+    ('yua', 'Yucatec Maya', "Màaya T'àan", None, None, None, None, None, 'Mayan', None, 'yua', 'yuca1254', 'Latn', 'Mexico; Belize', 'bing', None, None, None, None, None, None, None, None),
+    ('zu', 'Zulu', 'isiZulu', 'Ukuhumusha i-%s', 'Izincazelo ze-%s', 'Amagama afanayo', 'Izibonelo', 'Bheka futhi', 'Atlantic-Congo', 'Bantu', 'zul', 'zulu1248', 'Latn', 'South Africa; Lesotho; Eswatini', 'google; bing; yandex', None, None, None, None, None, None, None, None),
+)
@@ -1,22 +1,22 @@
+import argparse
 import subprocess
+from typing import Optional
 
+from .probe import first_available
 
-def init_audio_player():
+
+# Supported audio players, in order of preference, with the command line to play with
+AUDIO_PLAYERS = {
+    'mpv': 'mpv --no-config',
+    'mplayer': 'mplayer',
+    'mpg123': 'mpg123',
+}
+
+
+def init_audio_player(options: Optional[argparse.Namespace] = None):
     """Initialize audio player by checking availability of various players."""
-    try:
-        # Check for mpv
-        if subprocess.call(['mpv'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0:
-            return 'mpv --no-config'
-        # Check for mplayer
-        elif subprocess.call(['mplayer'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0:
-            return 'mplayer'
-        # Check for mpg123
-        elif subprocess.call(['mpg123', '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0:
-            return 'mpg123'
-        else:
-            return ''
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return ''
+    player = first_available(list(AUDIO_PLAYERS), options)
+    return AUDIO_PLAYERS[player] if player else ''
 
 
 def play_remote_audio(player: str, url: str):
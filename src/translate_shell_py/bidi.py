@@ -0,0 +1,285 @@
+# Conversion of logical strings to visual order for display, after the Unicode Bidirectional Algorithm (UAX #9).
+#
+# Each line is a paragraph of its own, with its direction taken from its first strong character, as `fribidi` does.
+# Explicit embeddings and overrides are ignored, and isolates are treated as neutral characters.
+import unicodedata
+from typing import List, Optional
+
+# Bidi classes that are neutral or isolate formatting characters, rules N1 and N2
+_NEUTRAL_TYPES = frozenset(('B', 'S', 'WS', 'ON', 'LRI', 'RLI', 'FSI', 'PDI'))
+# Bidi classes removed by rule X9
+_REMOVED_TYPES = frozenset(('RLE', 'LRE', 'RLO', 'LRO', 'PDF', 'BN'))
+# Bidi classes reset to the paragraph level at the end of a line, rule L1
+_TRAILING_TYPES = frozenset(('WS', 'LRI', 'RLI', 'FSI', 'PDI')) | _REMOVED_TYPES
+
+# Paired brackets, rule N0, opening bracket to closing bracket
+BRACKET_PAIRS = {
+    '(': ')', '[': ']', '{': '}', '༺': '༻', '༼': '༽', '᚛': '᚜', '⁅': '⁆',
+    '⁽': '⁾', '₍': '₎', '⌈': '⌉', '⌊': '⌋', '〈': '〉',
+    '❨': '❩', '❪': '❫', '❬': '❭', '❮': '❯', '❰': '❱',
+    '❲': '❳', '❴': '❵', '⟦': '⟧', '⟨': '⟩', '⟪': '⟫',
+    '⦃': '⦄', '⦅': '⦆', '⦇': '⦈', '⦉': '⦊', '⦋': '⦌',
+    '〈': '〉', '《': '》', '「': '」', '『': '』', '【': '】',
+    '〔': '〕', '〖': '〗', '〘': '〙', '〚': '〛', '﹙': '﹚',
+    '﹛': '﹜', '﹝': '﹞', '（': '）', '［': '］', '｛': '｝',
+    '｟': '｠', '｢': '｣',
+}
+_CLOSING_BRACKETS = {closing: opening for opening, closing in BRACKET_PAIRS.items()}
+# Depth of the bracket stack, rule BD16
+_MAX_BRACKET_DEPTH = 63
+
+# Glyphs swapped in right-to-left runs, rule L4
+MIRRORS = {
+    **BRACKET_PAIRS, **_CLOSING_BRACKETS,
+    '<': '>', '>': '<', '«': '»', '»': '«', '‹': '›', '›': '‹',
+    '≤': '≥', '≥': '≤', '∈': '∋', '∋': '∈', '⊂': '⊃',
+    '⊃': '⊂', '⊆': '⊇', '⊇': '⊆',
+}
+
+
+def _strong(bidi_type: str) -> Optional[str]:
+    """Return the strong direction a resolved type counts as for rules N0 and N1, numbers count as R"""
+    if bidi_type == 'L':
+        return 'L'
+    if bidi_type in ('R', 'AL', 'EN', 'AN'):
+        return 'R'
+    return None
+
+
+def paragraph_level(text: str) -> int:
+    """Return the embedding level of a paragraph: 1 if its first strong character is right-to-left, 0 otherwise"""
+    isolates = 0
+    for char in text:
+        bidi_type = unicodedata.bidirectional(char)
+        if bidi_type in ('LRI', 'RLI', 'FSI'):
+            isolates += 1
+        elif bidi_type == 'PDI':
+            isolates = max(0, isolates - 1)
+        elif isolates == 0 and bidi_type == 'L':
+            return 0
+        elif isolates == 0 and bidi_type in ('R', 'AL'):
+            return 1
+    return 0
+
+
+def _resolve_weak(types: List[str], sos: str) -> None:
+    """Resolve weak types, rules W1 to W7"""
+    # W1: non-spacing marks take the type of the preceding character
+    previous = sos
+    for i, bidi_type in enumerate(types):
+        if bidi_type == 'NSM':
+            types[i] = 'ON' if previous in ('LRI', 'RLI', 'FSI', 'PDI') else previous
+        previous = types[i]
+
+    # W2: European numbers after Arabic letters are Arabic numbers, W3: Arabic letters are R
+    last_strong = sos
+    for i, bidi_type in enumerate(types):
+        if bidi_type in ('L', 'R', 'AL'):
+            last_strong = bidi_type
+        elif bidi_type == 'EN' and last_strong == 'AL':
+            types[i] = 'AN'
+    for i, bidi_type in enumerate(types):
+        if bidi_type == 'AL':
+            types[i] = 'R'
+
+    # W4: a single separator between two numbers of the same kind joins them
+    for i in range(1, len(types) - 1):
+        before, after = types[i - 1], types[i + 1]
+        if types[i] == 'ES' and before == after == 'EN':
+            types[i] = 'EN'
+        elif types[i] == 'CS' and before == after and before in ('EN', 'AN'):
+            types[i] = before
+
+    # W5: terminators next to European numbers belong to them
+    i = 0
+    while i < len(types):
+        if types[i] != 'ET':
+            i += 1
+            continue
+        end = i
+        while end < len(types) and types[end] == 'ET':
+            end += 1
+        if (i > 0 and types[i - 1] == 'EN') or (end < len(types) and types[end] == 'EN'):
+            types[i:end] = ['EN'] * (end - i)
+        i = end
+
+    # W6: remaining separators and terminators are neutral
+    for i, bidi_type in enumerate(types):
+        if bidi_type in ('ES', 'ET', 'CS'):
+            types[i] = 'ON'
+
+    # W7: European numbers in left-to-right context are L
+    last_strong = sos
+    for i, bidi_type in enumerate(types):
+        if bidi_type in ('L', 'R'):
+            last_strong = bidi_type
+        elif bidi_type == 'EN' and last_strong == 'L':
+            types[i] = 'L'
+
+
+def _resolve_brackets(text: str, types: List[str], original_types: List[str], embedding: str, sos: str) -> None:
+    """Give paired brackets the direction of their content or context, rule N0"""
+    pairs = []
+    stack = []
+    for i, char in enumerate(text):
+        if types[i] != 'ON':
+            continue
+        if char in BRACKET_PAIRS:
+            if len(stack) == _MAX_BRACKET_DEPTH:
+                break
+            stack.append((BRACKET_PAIRS[char], i))
+        elif char in _CLOSING_BRACKETS:
+            for depth in range(len(stack) - 1, -1, -1):
+                if stack[depth][0] == char:
+                    pairs.append((stack[depth][1], i))
+                    del stack[depth:]
+                    break
+    pairs.sort()
+
+    for opening, closing in pairs:
+        inside = {_strong(bidi_type) for bidi_type in types[opening + 1:closing]}
+        if embedding in inside:
+            direction = embedding
+        elif inside - {None}:
+            # The brackets take the direction of the preceding context, which is either the opposite direction
+            # or the embedding direction
+            direction = next((_strong(bidi_type) for bidi_type in reversed(types[:opening]) if _strong(bidi_type)),
+                             sos)
+        else:
+            continue
+        for bracket in (opening, closing):
+            types[bracket] = direction
+            # Marks on a bracket follow it
+            following = bracket + 1
+            while following < len(types) and original_types[following] == 'NSM':
+                types[following] = direction
+                following += 1
+
+
+def _resolve_neutrals(types: List[str], embedding: str, sos: str) -> None:
+    """Resolve neutral characters from their surroundings, rules N1 and N2"""
+    i = 0
+    while i < len(types):
+        if types[i] not in _NEUTRAL_TYPES:
+            i += 1
+            continue
+        end = i
+        while end < len(types) and types[end] in _NEUTRAL_TYPES:
+            end += 1
+        before = _strong(types[i - 1]) if i > 0 else sos
+        after = _strong(types[end]) if end < len(types) else sos
+        direction = before if before == after else embedding
+        types[i:end] = [direction] * (end - i)
+        i = end
+
+
+def reorder_line(text: str) -> str:
+    """Convert a single line from logical to visual order"""
+    original_types = [unicodedata.bidirectional(char) or 'L' for char in text]
+    if not any(bidi_type in ('R', 'AL', 'AN') for bidi_type in original_types):
+        # Nothing right-to-left, the line is displayed as it is
+        return text
+
+    level = paragraph_level(text)
+    embedding = 'R' if level else 'L'
+    kept = [i for i, bidi_type in enumerate(original_types) if bidi_type not in _REMOVED_TYPES]
+    chars = [text[i] for i in kept]
+    types = [original_types[i] for i in kept]
+    kept_types = list(types)
+
+    # There are no explicit embeddings, so the line is a single isolating run sequence at the paragraph level
+    _resolve_weak(types, embedding)
+    _resolve_brackets(''.join(chars), types, kept_types, embedding, embedding)
+    _resolve_neutrals(types, embedding, embedding)
+
+    # I1 and I2: implicit levels
+    levels = []
+    for bidi_type in types:
+        if level == 0:
+            levels.append({'R': 1, 'AN': 2, 'EN': 2}.get(bidi_type, 0))
+        else:
+            levels.append(1 if bidi_type == 'R' else 2)
+
+    # L1: separators and trailing whitespace go back to the paragraph level
+    trailing = True
+    for i in range(len(chars) - 1, -1, -1):
+        if kept_types[i] in ('S', 'B'):
+            levels[i] = level
+            trailing = True
+        elif trailing and kept_types[i] in _TRAILING_TYPES:
+            levels[i] = level
+        else:
+            trailing = False
+
+    # L4: mirrored glyphs in right-to-left runs
+    chars = [MIRRORS.get(char, char) if levels[i] % 2 else char for i, char in enumerate(chars)]
+
+    # L2: reverse every run at or above each odd level, from the highest level down
+    order = list(range(len(chars)))
+    highest = max(levels, default=0)
+    lowest_odd = min((lvl for lvl in levels if lvl % 2), default=highest + 1)
+    for current in range(highest, lowest_odd - 1, -1):
+        i = 0
+        while i < len(order):
+            if levels[order[i]] < current:
+                i += 1
+                continue
+            end = i
+            while end < len(order) and levels[order[end]] >= current:
+                end += 1
+            order[i:end] = order[i:end][::-1]
+            i = end
+
+    # L3: reversing put the combining marks of right-to-left runs before their base character, move them back after it
+    i = 0
+    while i < len(order):
+        run_level = levels[order[i]]
+        if kept_types[order[i]] != 'NSM' or run_level % 2 == 0:
+            i += 1
+            continue
+        end = i
+        while end < len(order) and kept_types[order[end]] == 'NSM' and levels[order[end]] == run_level:
+            end += 1
+        if end < len(order) and levels[order[end]] == run_level:
+            end += 1  # the base character
+        order[i:end] = order[i:end][::-1]
+        i = end
+    return ''.join(chars[i] for i in order)
+
+
+def display_width(text: str) -> int:
+    """Return the number of terminal columns a string takes up"""
+    width = 0
+    for char in text:
+        if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+def to_visual(text: str, width: Optional[int] = None) -> str:
+    """Convert a logical string to visual order, line by line.
+
+    If width is given, right-to-left lines are right justified to that many columns."""
+    lines = []
+    for line in text.split('\n'):
+        visual = reorder_line(line)
+        if width and paragraph_level(line):
+            visual = ' ' * max(0, width - display_width(visual)) + visual
+        lines.append(visual)
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    # Combining marks stay after their base character, rule L3
+    shalom = '\u05e9\u05c1\u05b8\u05dc\u05d5\u05b9\u05dd'  # Hebrew with points
+    assert reorder_line(shalom) == '\u05dd\u05d5\u05b9\u05dc\u05e9\u05c1\u05b8', reorder_line(shalom)
+    salam = '\u0633\u064e\u0644\u064e\u0627\u0645'  # Arabic with harakat
+    assert reorder_line(salam) == '\u0645\u0627\u0644\u064e\u0633\u064e', reorder_line(salam)
+    mixed = 'abc \u05e9\u05c1\u05b8\u05dc def'
+    assert reorder_line(mixed) == 'abc \u05dc\u05e9\u05c1\u05b8 def', reorder_line(mixed)
+    # Marks in left-to-right text are left alone
+    assert reorder_line('e\u0301 \u05d0') == 'e\u0301 \u05d0'
+    # Brackets are mirrored and numbers keep their order
+    assert reorder_line('\u05d0 (\u05d1) 123') == '123 (\u05d1) \u05d0', reorder_line('\u05d0 (\u05d1) 123')
+    print(to_visual(shalom, 20) + '|')
@@ -0,0 +1,77 @@
+import threading
+import time
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding the requests of an engine.
+
+    While closed, requests pass. After `failure_threshold` consecutive failed requests the circuit opens, and requests
+    fail immediately instead of waiting for an engine that is down or rate limiting. Once `reset_timeout` seconds have
+    passed, the circuit is half-open: a single probe request is let through, its success closes the circuit again and
+    its failure keeps it open for another `reset_timeout` seconds."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check if a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Let this request through as the probe, the others keep failing until it is done
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Account for a successful request"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def release_probe(self) -> None:
+        """Give up the probe request without an outcome, so that the next request probes instead of it"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_failure(self) -> bool:
+        """Account for a failed request, return True if the circuit has opened because of it"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED
+                                                and self._failures >= self.failure_threshold):
+                was_closed = self.state == self.CLOSED
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return was_closed
+            return False
+
+
+if __name__ == "__main__":
+    # A probe given up without an outcome must not leave the circuit half-open for good
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    assert not breaker.record_failure() and breaker.record_failure() and not breaker.allow()
+    time.sleep(0.15)
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # only one probe at a time
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.OPEN
+    # The reset timeout has already passed, so the next request probes right away
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+    # Releasing outside of a probe changes nothing
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.CLOSED
+    print("Circuit breaker checks passed")
@@ -0,0 +1,118 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from typing import Iterable, Optional
+
+
+def _warning(message: str) -> None:
+    """Print warning message"""
+    print(message, file=sys.stderr)
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory, following the XDG base directory specification"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'translate-shell-py')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for use in a cache key. Only differences that cannot change the translation are removed."""
+    return unicodedata.normalize('NFC', text).strip()
+
+
+class TranslationCache:
+    """Persistent on-disk cache of raw engine responses, backed by SQLite.
+
+    Entries expire after `ttl` seconds. Once the cache holds more than `max_entries` responses, the least recently
+    used ones are evicted. The database may be shared by several processes and threads."""
+
+    # Number of insertions between two eviction passes
+    EVICTION_INTERVAL = 100
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._insertions = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                         'key TEXT PRIMARY KEY, content TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+        self.evict()
+
+    @staticmethod
+    def from_options(options: argparse.Namespace) -> Optional["TranslationCache"]:
+        """Open the cache configured on the command line, or return None if caching is disabled or unavailable"""
+        if options.no_cache:
+            return None
+        path = os.path.join(options.cache_dir or default_cache_dir(), 'translations.sqlite3')
+        try:
+            return TranslationCache(path, options.cache_ttl, options.cache_size)
+        except (OSError, sqlite3.Error) as e:
+            _warning(f'[WARNING] Translation cache disabled, could not open {path}: {e}')
+            return None
+
+    @staticmethod
+    def make_key(engine: str, sl: str, tl: str, hl: str, autocorrect: bool, text: str, fields: Iterable[str] = ()
+                 ) -> str:
+        """Build the cache key of a request"""
+        parts = [engine, sl, tl, hl, 'qca' if autocorrect else 'qc', normalize_text(text)]
+        if fields:
+            parts.insert(5, ','.join(fields))
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached response for key, or None if there is no fresh entry"""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._db.execute('SELECT content, created FROM responses WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                content, created = row
+                if now - created > self.ttl:
+                    self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    return None
+                self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+                # Entries written before responses were kept as bytes hold text
+                return content.encode('utf-8') if isinstance(content, str) else content
+        except sqlite3.Error as e:
+            _warning(f'[WARNING] Translation cache lookup failed: {e}')
+            return None
+
+    def put(self, key: str, content: bytes) -> None:
+        """Store a response under key"""
+        now = time.time()
+        try:
+            with self._lock:
+                self._db.execute('INSERT OR REPLACE INTO responses (key, content, created, accessed) '
+                                 'VALUES (?, ?, ?, ?)', (key, content, now, now))
+                self._insertions += 1
+                if self._insertions < self.EVICTION_INTERVAL:
+                    return
+            self.evict()
+        except sqlite3.Error as e:
+            _warning(f'[WARNING] Translation cache update failed: {e}')
+
+    def evict(self) -> None:
+        """Remove expired entries, then the least recently used ones until the size bound holds"""
+        with self._lock:
+            self._insertions = 0
+            self._db.execute('DELETE FROM responses WHERE created < ?', (time.time() - self.ttl,))
+            self._db.execute('DELETE FROM responses WHERE key IN ('
+                             'SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                             (max(0, self.max_entries),))
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,583 @@
+import argparse
+import copy
+import os
+import sys
+from typing import List, Optional, Dict
+
+from .config import load_init_script
+from .engines.google_translate import GoogleTranslationEngine
+from .engines.bing_translator import BingTranslatorEngine
+from .interactive import InteractiveShell, run_emacs_mode
+from .misc import _yn_to_bool, _get_user_lang, _parse_language_codes, _parse_shortcut_format
+from .audio import init_audio_player
+from .cache import default_cache_dir
+from .client import default_socket_path
+from .deadline import Deadline
+from .langdata import Cache as display_cache
+from .translate import TranslationEngine
+from .unimpl import _get_version
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser with default values"""
+    parser = argparse.ArgumentParser(
+        prog='trans',
+        description='Command-line translation tool',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=False  # We'll handle help ourselves
+    )
+
+    # Get default values
+    default_width = int(os.environ.get('COLUMNS', 0)) - 2 if os.environ.get('COLUMNS') else 0
+    default_user_lang = _get_user_lang()
+    default_user_agent = (os.environ.get('USER_AGENT') or
+                         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                         'AppleWebKit/537.36 (KHTML, like Gecko) '
+                         'Chrome/104.0.0.0 '
+                         'Safari/537.36 '
+                         'Edg/104.0.1293.54')
+
+    # Information options
+    info_group = parser.add_argument_group('Information Options')
+    info_group.add_argument('-V', '--version', action='store_const',
+                            const='version', dest='info_only',
+                            help='Show version information')
+    info_group.add_argument('-H', '--help', action='store_const',
+                            const='help', dest='info_only',
+                            help='Show help message')
+    info_group.add_argument('-M', '--man', '--manual', action='store_const',
+                            const='manual', dest='info_only',
+                            help='Show manual page')
+    info_group.add_argument('-T', '--reference', action='store_const',
+                            const='reference', dest='info_only',
+                            help='Show language reference')
+    info_group.add_argument('-R', '--reference-english', action='store_const',
+                            const='reference-english', dest='info_only',
+                            help='Show language reference in English')
+    info_group.add_argument('-S', '--list-engines', action='store_const',
+                            const='list-engines', dest='info_only',
+                            help='List available translation engines')
+    info_group.add_argument('--list-languages', action='store_const',
+                            const='list-languages', dest='info_only',
+                            help='List available languages')
+    info_group.add_argument('--list-languages-english', action='store_const',
+                            const='list-languages-english', dest='info_only',
+                            help='List available languages in English')
+    info_group.add_argument('--list-codes', action='store_const',
+                            const='list-codes', dest='info_only',
+                            help='List language codes')
+    info_group.add_argument('--list-all', action='store_const',
+                            const='list-all', dest='info_only',
+                            help='List all language information')
+    info_group.add_argument('-L', '--linguist', nargs='?', const='',
+                            metavar='CODES', dest='linguist_codes',
+                            help='Show linguist information for language codes')
+    info_group.add_argument('-U', '--upgrade', action='store_const',
+                            const='upgrade', dest='info_only',
+                            help='Upgrade the program')
+    info_group.add_argument('-N', '--nothing', action='store_const',
+                            const='nothing', dest='info_only',
+                            help='Do nothing')
+
+    # Translator options
+    trans_group = parser.add_argument_group('Translator Options')
+    trans_group.add_argument('-e', '--engine', metavar='ENGINE', default='google',
+                             help='Translation engine to use (default: google)')
+    trans_group.add_argument('--fallback-engine', metavar='ENGINE', default=None,
+                             help='Translation engine to use for translations that fail with the main engine')
+    trans_group.add_argument('--hedge', type=float, metavar='PERCENTILE', default=0,
+                             help='Also send a translation to the fallback engine if the main engine has not answered '
+                                  'within the given percentile of its recent response times (default: 0, disabled)')
+
+    # Display options
+    display_group = parser.add_argument_group('Display Options')
+    display_group.add_argument('--verbose', action='store_true', default=True,
+                               help='Verbose output (default)')
+    display_group.add_argument('-b', '--brief', action='store_true', default=False,
+                               help='Brief output')
+    display_group.add_argument('-d', '--dictionary', action='store_true', default=False,
+                               help='Show dictionary entries')
+    display_group.add_argument('--identify', action='store_true', default=False,
+                               help='Language identification mode')
+    display_group.add_argument('--show-original', metavar='Y/n', default='Y',
+                               help='Show original text (default: Y)')
+    display_group.add_argument('--show-original-phonetics', metavar='Y/n', default='Y',
+                               help='Show original phonetics (default: Y)')
+    display_group.add_argument('--show-translation', metavar='Y/n', default='Y',
+                               help='Show translation (default: Y)')
+    display_group.add_argument('--show-translation-phonetics', metavar='Y/n', default='Y',
+                               help='Show translation phonetics (default: Y)')
+    display_group.add_argument('--show-prompt-message', metavar='Y/n', default='Y',
+                               help='Show prompt message (default: Y)')
+    display_group.add_argument('--show-languages', metavar='Y/n', default='Y',
+                               help='Show languages (default: Y)')
+    display_group.add_argument('--show-original-dictionary', metavar='y/N', default='N',
+                               help='Show original dictionary (default: N)')
+    display_group.add_argument('--show-dictionary', metavar='Y/n', default='Y',
+                               help='Show dictionary (default: Y)')
+    display_group.add_argument('--show-alternatives', metavar='Y/n', default='Y',
+                               help='Show alternatives (default: Y)')
+    display_group.add_argument('-w', '--width', type=int, metavar='NUM', default=default_width,
+                               help=f'Output width (default: {default_width})')
+    display_group.add_argument('--indent', type=int, metavar='NUM', default=4,
+                               help='Indentation (default: 4)')
+    display_group.add_argument('--theme', metavar='FILENAME', default='default',
+                               help='Theme file (default: default)')
+    display_group.add_argument('--no-theme', action='store_true', default=False,
+                               help='Disable theme')
+    display_group.add_argument('--no-ansi', action='store_true', default=False,
+                               help='Disable ANSI escape codes')
+    display_group.add_argument('--no-autocorrect', action='store_true', default=False,
+                               help='Disable autocorrection')
+    display_group.add_argument('--no-bidi', action='store_true', default=False,
+                               help='Disable bidirectional text')
+    display_group.add_argument('--bidi', action='store_true', default=False,
+                               help='Force bidirectional text')
+    display_group.add_argument('--no-warn', action='store_true', default=False,
+                               help='Disable warnings')
+    display_group.add_argument('--dump', action='store_true', default=False,
+                               help='Dump raw output')
+
+    # Audio options
+    audio_group = parser.add_argument_group('Audio Options')
+    audio_group.add_argument('-p', '--play', action='store_const', const=1, dest='audio_mode',
+                             default=0, help='Play audio')
+    audio_group.add_argument('--speak', action='store_const', const=2, dest='audio_mode',
+                             help='Speak translation')
+    audio_group.add_argument('-n', '--narrator', metavar='VOICE', default='female',
+                             help='Voice for narration (default: female)')
+    audio_group.add_argument('--audio-player', metavar='PROGRAM', default=os.environ.get('PLAYER'),
+                             dest='audio_player', help='Audio player program')
+    audio_group.add_argument('--no-play', action='store_const', const=0, dest='audio_mode',
+                             help='Disable audio playback')
+    audio_group.add_argument('--no-translate', action='store_true', default=False,
+                             help='Skip translation, only play audio')
+    audio_group.add_argument('--download-audio', action='store_true', default=False,
+                             help='Download audio file')
+    audio_group.add_argument('--download-audio-as', metavar='FILENAME',
+                             help='Download audio as specific filename')
+    audio_group.add_argument('--repeat-tty-capture', action='store_true', default=False,
+                             help='Repeat TTY capture')
+
+    # Terminal paging and browsing
+    term_group = parser.add_argument_group('Terminal Options')
+    term_group.add_argument('-v', '--view', action='store_true', default=False,
+                            help='View output in pager')
+    term_group.add_argument('--pager', metavar='PROGRAM', default=os.environ.get('PAGER'),
+                            help='Pager program')
+    term_group.add_argument('--no-view', '--no-pager', action='store_true', default=False,
+                            help='Disable pager')
+    term_group.add_argument('--browser', metavar='PROGRAM', default=os.environ.get('BROWSER'),
+                            help='Browser program')
+    term_group.add_argument('--no-browser', action='store_true', default=False,
+                            help='Disable browser')
+
+    # Networking options
+    net_group = parser.add_argument_group('Networking Options')
+    net_group.add_argument('-x', '--proxy', metavar='HOST:PORT',
+                           default=os.environ.get('HTTP_PROXY') or os.environ.get('http_proxy'),
+                           help='HTTP proxy')
+    net_group.add_argument('-u', '--user-agent', metavar='STRING', default=default_user_agent,
+                           help='User agent string')
+    net_group.add_argument('-4', '--ipv4', '--inet4-only', action='store_const',
+                           const=4, dest='ip_version', default=0,
+                           help='Use IPv4 only')
+    net_group.add_argument('-6', '--ipv6', '--inet6-only', action='store_const',
+                           const=6, dest='ip_version',
+                           help='Use IPv6 only')
+    net_group.add_argument('--pool-size', type=int, metavar='NUM', default=10,
+                           help='Number of pooled keep-alive connections per engine (default: 10)')
+    net_group.add_argument('--jobs', type=int, metavar='NUM', default=8,
+                           help='Maximum number of concurrent requests, the number of requests in flight adapts to '
+                                'how the engine responds up to this limit (default: 8)')
+    net_group.add_argument('--batch', type=int, metavar='NUM', default=0,
+                           help='Pack up to NUM input lines into one request in brief mode, if the engine supports it '
+                                '(default: 0, disabled)')
+    net_group.add_argument('--connect-timeout', type=float, metavar='SECONDS', default=10,
+                           help='Timeout for connecting to the engine (default: 10)')
+    net_group.add_argument('--read-timeout', type=float, metavar='SECONDS', default=30,
+                           help='Timeout for waiting on a response of the engine (default: 30)')
+    net_group.add_argument('--translation-timeout', type=float, metavar='SECONDS', default=0,
+                           help='Time budget for translating a text into all target languages, retries included '
+                                '(default: 0, unlimited)')
+    net_group.add_argument('--run-timeout', type=float, metavar='SECONDS', default=0,
+                           help='Time budget for the whole run, translations left after it are skipped '
+                                '(default: 0, unlimited)')
+    net_group.add_argument('--max-attempts', type=int, metavar='NUM', default=4,
+                           help='Maximum number of attempts per request, failed requests are retried with backoff '
+                                '(default: 4)')
+    net_group.add_argument('--retry-budget', type=float, metavar='SECONDS', default=60,
+                           help='Give up retrying a request SECONDS after its first attempt (default: 60)')
+    net_group.add_argument('--max-rps', type=float, metavar='RATE', default=0,
+                           help='Limit requests to the engine to RATE per second, shared by all local processes '
+                                '(default: 0, unlimited)')
+    net_group.add_argument('--burst', type=float, metavar='NUM', default=0,
+                           help='Number of requests that may exceed --max-rps in a short burst '
+                                '(default: 0, one second\'s worth)')
+    net_group.add_argument('--breaker-threshold', type=int, metavar='NUM', default=5,
+                           help='Stop sending requests to an engine after NUM consecutive failures (default: 5)')
+    net_group.add_argument('--breaker-timeout', type=float, metavar='SECONDS', default=30,
+                           help='Try an engine again SECONDS after it was stopped (default: 30)')
+
+    # Cache options
+    cache_group = parser.add_argument_group('Cache Options')
+    cache_group.add_argument('--no-cache', action='store_true', default=False,
+                             help='Do not cache engine responses on disk')
+    cache_group.add_argument('--cache-dir', metavar='DIR', default=None,
+                             help=f'Cache directory (default: {default_cache_dir()})')
+    cache_group.add_argument('--cache-ttl', type=int, metavar='SECONDS', default=30 * 24 * 3600,
+                             help='Lifetime of cached responses (default: 30 days)')
+    cache_group.add_argument('--cache-size', type=int, metavar='NUM', default=100000,
+                             help='Maximum number of cached responses (default: 100000)')
+
+    # Interactive shell options
+    shell_group = parser.add_argument_group('Interactive Shell Options')
+    shell_group.add_argument('-I', '--interactive', '--shell', action='store_true', default=False,
+                             help='Interactive shell mode')
+    shell_group.add_argument('-E', '--emacs', action='store_true', default=False,
+                             help='Emacs front-end mode')
+    shell_group.add_argument('--no-rlwrap', action='store_true', default=False,
+                             help='Disable rlwrap')
+
+    # I/O options
+    io_group = parser.add_argument_group('I/O Options')
+    io_group.add_argument('-i', '--input', metavar='FILENAME',
+                          help='Input file')
+    io_group.add_argument('-o', '--output', metavar='FILENAME', default=sys.stdout,
+                          help='Output file')
+
+    # Language options
+    lang_group = parser.add_argument_group('Language Options')
+    lang_group.add_argument('--hl', '--host', metavar='CODE', dest='host_lang',
+                            default=(os.environ.get('HOST_LANG') or
+                                    os.environ.get('HOME_LANG') or
+                                    default_user_lang),
+                            help='Host language')
+    lang_group.add_argument('-s', '--sl', '--source', '-f', '--from',
+                            metavar='CODES', dest='source_lang',
+                            default=os.environ.get('SOURCE_LANG', 'auto'),
+                            help='Source language')
+    lang_group.add_argument('-t', '--tl', '--target', '--to',
+                            metavar='CODES', dest='target_langs',
+                            default=os.environ.get('TARGET_LANG') or default_user_lang,
+                            help='Target language(s)')
+
+    # Text preprocessing
+    preproc_group = parser.add_argument_group('Text Preprocessing Options')
+    preproc_group.add_argument('-j', '--join-sentence', action='store_true', default=False,
+                               help='Join sentences')
+
+    # Other options
+    other_group = parser.add_argument_group('Other Options')
+    other_group.add_argument('-D', '--debug', action='store_true', default=False,
+                             help='Debug mode')
+    other_group.add_argument('--no-init', action='store_true', default=False,
+                             help='Skip initialization script')
+    other_group.add_argument('--no-op', action='store_true', default=False,
+                             help='No operation')
+    other_group.add_argument('--daemon', action='store_true', default=False,
+                             help='Run as a resident daemon that serves later invocations')
+    other_group.add_argument('--daemon-socket', metavar='PATH', default=default_socket_path(),
+                             help=f'Socket of the daemon (default: {default_socket_path()})')
+    other_group.add_argument('--no-daemon', action='store_true', default=False,
+                             help='Do not forward this invocation to a running daemon')
+
+    # Positional arguments (text to translate and shortcut formats)
+    parser.add_argument('text', nargs='*', help='Text to translate or language shortcuts')
+
+    return parser
+
+
+def _handle_special_args(args: List[str]) -> List[str]:
+    """Handle special argument formats before parsing"""
+    processed_args = []
+    i = 0
+
+    while i < len(args):
+        arg = args[i]
+
+        # Handle shortcut format for engines: '/ENGINE'
+        if arg.startswith('/') and len(arg) > 1:
+            processed_args.extend(['--engine', arg[1:]])
+            i += 1
+            continue
+
+        # Handle shortcut format for languages: 'CODE:CODE' or 'CODE=CODE'
+        lang_shortcut = _parse_shortcut_format(arg)
+        if lang_shortcut:
+            if 'sls' in lang_shortcut:
+                processed_args.extend(['--source', '+'.join(lang_shortcut['sls'])])
+            if 'tl' in lang_shortcut:
+                processed_args.extend(['--target', '+'.join(lang_shortcut['tl'])])
+            i += 1
+            continue
+
+        processed_args.append(arg)
+        i += 1
+
+    return processed_args
+
+
+def _post_process_options(options) -> argparse.Namespace:
+    """Post-process options after parsing"""
+
+    # TODO: move to info only handling
+    if hasattr(options, 'linguist_codes') and options.linguist_codes is not None:
+        info_only = 'language'
+        if options.linguist_codes:
+            options.target_langs = options.linguist_codes
+        return options # TODO: weird early return
+
+    # Handle brief mode
+    if options.brief:
+        options.verbose = False
+
+    # Handle dictionary mode
+    if options.dictionary:
+        options.show_original_dictionary = True
+        options.show_dictionary = False
+        options.show_alternatives = False
+
+    # Handle identify mode
+    if options.identify:
+        options.verbose = max(0, getattr(options, 'verbose', 1) - 2)
+
+    # Handle theme disable
+    if options.no_theme:
+        options.theme = ''
+
+    # Handle Y/n options conversion
+    yn_options = [
+        'show_original', 'show_original_phonetics', 'show_translation',
+        'show_translation_phonetics', 'show_prompt_message', 'show_languages',
+        'show_original_dictionary', 'show_dictionary', 'show_alternatives'
+    ]
+
+    for opt in yn_options:
+        value = getattr(options, opt.replace('-', '_'), None)
+        if isinstance(value, str):
+            setattr(options, opt.replace('-', '_'), _yn_to_bool(value))
+
+    # Handle view disable
+    if options.no_view:
+        options.view = False
+
+    # Handle browser disable
+    if options.no_browser:
+        options.browser = None
+
+    # Start the clock of the whole run
+    options.run_deadline = Deadline(options.run_timeout)
+
+    # Parse language codes
+    options.source_lang = options.source_lang or 'auto'
+
+    if isinstance(options.target_langs, str):
+        options.target_langs = _parse_language_codes(options.target_langs)
+    else:
+        options.target_langs = options.target_langs or [_get_user_lang()]
+
+    # Handle download audio as
+    if options.download_audio_as:
+        options.download_audio = True
+
+    # Handle narrator/player with play mode
+    if (options.narrator != 'female' or options.audio_player) and options.audio_mode == 0:
+        options.audio_mode = 1
+
+    return options
+
+
+def parse_args(args: Optional[List[str]]) -> argparse.Namespace:
+    parser = create_parser()
+    args = _handle_special_args(args)
+    parsed_args = parser.parse_args(args)
+    parsed_args = _post_process_options(parsed_args)
+    return parsed_args
+
+
+class TranslationCLI:
+    """Main translation CLI class"""
+
+    def __init__(self, resident: bool = False):
+        self.exit_code = 0
+        self.options = None
+        self.engine: Optional[TranslationEngine] = None
+        self.engines: Dict[str, type[TranslationEngine]] = {
+            'google': GoogleTranslationEngine,
+            'bing': BingTranslatorEngine,
+        }
+        # A resident CLI serves many runs, it keeps its engines and the detected audio player between them
+        self.resident = resident
+        self.resident_engines: Dict[str, TranslationEngine] = {}
+        self.detected_audio_player: Optional[str] = None
+
+    def init_misc(self):
+        """Initialize miscellaneous settings"""
+        # Enable color in the terminal on Windows
+        if os.name == 'nt':
+            os.system('color')
+
+        # Set screen width if not already set
+        if not self.options.width:
+            try:
+                import subprocess
+                result = subprocess.run(['tput', 'cols'], capture_output=True, text=True)
+                if result.returncode == 0:
+                    width = int(result.stdout.strip())
+                    self.options.width = max(width - 2, 64)
+            except:
+                self.options.width = 64
+
+        # Initialize browser if not set
+        # TODO: Is this necessary? It doesn't quite seem cross-platform. Looking at you Claude
+        if not self.options.browser:
+            import platform
+            system = platform.system()
+            self.options.browser = 'open' if system == 'Darwin' else 'xdg-open'
+
+    def init_engine(self):
+        # Release the previous engines' connections before replacing them
+        if self.engine and not self.resident:
+            self.engine.close()
+            if self.engine.fallback:
+                self.engine.fallback.close()
+        self.engine = self._get_engine(self.options)
+        self.engine.fallback = None
+
+        fallback_engine = self.options.fallback_engine
+        if fallback_engine and fallback_engine != self.options.engine:
+            # The fallback engine gets options of its own, as they name the engine in its messages
+            fallback_options = copy.copy(self.options)
+            fallback_options.engine = fallback_engine
+            try:
+                self.engine.fallback = self._get_engine(fallback_options)
+            except (RuntimeError, ValueError) as e:
+                # The run goes on without a fallback, e.g. for a misspelt engine name
+                print(f'[WARNING] Fallback engine {fallback_engine} is not available: {e}', file=sys.stderr)
+
+    def _get_engine(self, options: argparse.Namespace) -> TranslationEngine:
+        """Return an initialized engine, reusing a resident one if there is one"""
+        if options.engine not in self.engines:
+            raise ValueError(f'Unknown engine: {options.engine}')
+        engine = self.resident_engines.get(options.engine)
+        if engine and engine.can_reuse(options):
+            engine.update_options(options)
+            return engine
+        if engine:
+            # Built for other settings, e.g. another cache or pool size
+            del self.resident_engines[options.engine]
+            engine.close()
+        # Construct engine
+        engine = self.engines[options.engine](options)
+        try:
+            engine.initialize()
+        except Exception:
+            engine.close()
+            raise
+        if self.resident:
+            self.resident_engines[options.engine] = engine
+        return engine
+
+    def init_audio_engine(self):
+        if not self.options.audio_player:
+            if self.detected_audio_player is None:
+                self.detected_audio_player = init_audio_player(self.options)
+            self.options.audio_player = self.detected_audio_player
+
+    def close(self):
+        """Release all engines"""
+        engines = {self.engine, self.engine and self.engine.fallback, *self.resident_engines.values()}
+        for engine in engines - {None}:
+            engine.close()
+        self.engine = None
+        self.resident_engines.clear()
+
+    def run(self, args: Optional[List[str]] = None) -> int:
+        try:
+            self.options = parse_args(args)
+
+            if '--no-init' not in args:
+                load_init_script(self.options)
+
+            if self.options.info_only is not None:
+                return self._handle_info_request()
+
+            if self.options.daemon:
+                from .daemon import TranslationDaemon
+                return TranslationDaemon(self.options.daemon_socket).serve_forever()
+
+            self.init_misc()
+            self.init_engine()
+            self.init_audio_engine()
+
+            if self.options.interactive and not self.options.no_rlwrap:
+                return InteractiveShell(self).run_interactive()
+            elif self.options.emacs and not self.options.interactive and not self.options.no_rlwrap:
+                return run_emacs_mode()
+            else:
+                return self.run_single()
+
+        except KeyboardInterrupt:
+            return 130
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            raise
+        finally:
+            if self.engine:
+                self.engine.close_output()
+            if self.options and self.options.debug:
+                print(f'[DEBUG] Display cache: {display_cache.stats()}', file=sys.stderr)
+            if not self.resident:
+                self.close()
+
+    def run_single(self) -> int:
+        text_args = self.options.text if 'text' in self.options else []
+
+        if len(text_args) > 1 and self.options.join_sentence:
+            text_args = [' '.join(text_args)]
+
+        if text_args:
+            for i, text in enumerate(text_args):
+                if self.options.verbose and i > 0:
+                    # Print separator between sources
+                    print('-' * (self.options.width or 50))
+                self.engine.translate(text, self.options.source_lang, inline=True)
+        else:
+            # Handle input from file or stdin
+            if not self.options.input:
+                self.options.input = sys.stdin
+            self.engine.translate_stdin()
+
+        return self.exit_code
+
+    def _handle_info_request(self) -> int:
+        """Handle information-only requests"""
+        if self.info_only == 'version':
+            print(_get_version())
+        elif self.info_only == 'help':
+            parser = create_parser()
+            print(parser.format_help())
+        elif self.info_only == 'manual':
+            self._show_manual()
+        elif self.info_only == 'reference':
+            print(self._get_reference('endonym'))
+        elif self.info_only == 'reference-english':
+            print(self._get_reference('name'))
+        elif self.info_only == 'list-engines':
+            self._list_engines()
+        elif self.info_only == 'list-languages':
+            self._list_languages()
+        elif self.info_only == 'list-languages-english':
+            self._list_languages_english()
+        elif self.info_only == 'list-codes':
+            self._list_codes()
+        elif self.info_only == 'list-all':
+            self._list_all()
+        elif self.info_only == 'language':
+            print(self._get_language_info(self.options.tl))
+        elif self.info_only == 'upgrade':
+            self._upgrade()
+        elif self.info_only == 'nothing':
+            pass
+        return self.exit_code
@@ -0,0 +1,147 @@
+# Thin client for a resident translation daemon (see daemon.py).
+#
+# This module is imported on every invocation before anything else, so it must stay limited to the standard library
+# modules needed to talk to the daemon.
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+from typing import List, Optional
+
+# Messages are prefixed with their length, exit codes are sent as a single signed integer
+_LENGTH = struct.Struct('!I')
+_EXIT_CODE = struct.Struct('!i')
+# Credentials of the process on the other end of a Unix domain socket: pid, uid and gid
+_PEER_CREDENTIALS = struct.Struct('3i')
+
+
+def default_socket_path() -> str:
+    """Return the path of the daemon socket"""
+    if path := os.environ.get('TRAPY_SOCKET'):
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, 'trapy.sock')
+    return fallback_socket_path()
+
+
+def fallback_socket_path() -> str:
+    """Return the socket path used without a runtime directory, in a directory private to the user"""
+    # /tmp is shared with other users, see ensure_private_dir()
+    return os.path.join('/tmp', f'trapy-{os.getuid()}', 'trapy.sock')
+
+
+def is_supported() -> bool:
+    """Check if the platform supports passing file descriptors over Unix domain sockets and checking the peer"""
+    return hasattr(socket, 'AF_UNIX') and hasattr(socket, 'send_fds') and hasattr(socket, 'SO_PEERCRED')
+
+
+def ensure_private_dir(path: str) -> bool:
+    """Create the directory of a socket accessible to the current user only, or check that an existing one is"""
+    directory = os.path.dirname(path)
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def is_own_socket(path: str) -> bool:
+    """Check that path is a socket owned by the current user, and not something another user has put there"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def peer_uid(sock: socket.socket) -> int:
+    """Return the user id of the process on the other end of a connected Unix domain socket"""
+    _, uid, _ = _PEER_CREDENTIALS.unpack(
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size))
+    return uid
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    """Send a length-prefixed JSON message"""
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def receive_message(sock: socket.socket) -> dict:
+    """Receive a length-prefixed JSON message"""
+    length, = _LENGTH.unpack(_receive_exactly(sock, _LENGTH.size))
+    return json.loads(_receive_exactly(sock, length).decode('utf-8'))
+
+
+def send_exit_code(sock: socket.socket, exit_code: int) -> None:
+    """Send the exit code that ends a request"""
+    sock.sendall(_EXIT_CODE.pack(exit_code))
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    """Receive exactly size bytes"""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('Connection closed by peer')
+        data += chunk
+    return data
+
+
+def _socket_path_from_args(args: List[str]) -> str:
+    """Return the socket path given with --daemon-socket, or the default one"""
+    for i, arg in enumerate(args):
+        if arg == '--daemon-socket' and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith('--daemon-socket='):
+            return arg.split('=', 1)[1]
+    return default_socket_path()
+
+
+def run_client(args: List[str]) -> Optional[int]:
+    """Forward an invocation to the daemon and return its exit code.
+
+    The daemon receives this process' stdin, stdout and stderr and works on them directly, so input and output are
+    streamed without passing through the client. Returns None if no daemon of the current user is available, in which
+    case the invocation should be handled locally."""
+    if not is_supported() or '--daemon' in args or '--no-daemon' in args:
+        return None
+
+    path = _socket_path_from_args(args)
+    # The streams and the environment, which may hold credentials, are only handed to a daemon of the same user
+    if not is_own_socket(path):
+        return None
+
+    env = dict(os.environ)
+    # The daemon has no terminal of its own to measure
+    if 'COLUMNS' not in env:
+        try:
+            env['COLUMNS'] = str(os.get_terminal_size(sys.stdout.fileno()).columns)
+        except OSError:
+            pass
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            if peer_uid(sock) != os.getuid():
+                return None
+            socket.send_fds(sock, [b'\0'], [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()])
+            send_message(sock, {'args': args, 'cwd': os.getcwd(), 'env': env})
+            exit_code, = _EXIT_CODE.unpack(_receive_exactly(sock, _EXIT_CODE.size))
+            return exit_code
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Stale socket of a daemon that is no longer running
+        return None
+    except ConnectionError:
+        print('[ERROR] Lost connection to the translation daemon', file=sys.stderr)
+        return 1
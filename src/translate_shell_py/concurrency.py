@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Hashable, Optional, TypeVar
+
+from .deadline import Deadline
+
+T = TypeVar('T')
+
+
+class AdaptiveConcurrency:
+    """Limit on the number of requests in flight, adjusted by additive increase and multiplicative decrease (AIMD).
+
+    Every successful response raises the limit by 1/limit, i.e. by about one per round of requests, up to
+    `max_limit`. Signs of congestion (rate limiting, timeouts, server errors, or a response much slower than usual)
+    halve it, at most once per typical response time so that a single burst of failures counts only once."""
+
+    # A response slower than this multiple of the average latency counts as congestion
+    LATENCY_SPIKE_FACTOR = 3.0
+    # Number of responses to average latency over before spikes are detected
+    LATENCY_WARMUP = 8
+    # Weight of a new latency sample in the moving average
+    LATENCY_WEIGHT = 0.1
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self._limit = max(1.0, max_limit / 2)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._latency = 0.0
+        self._samples = 0
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    def acquire(self, deadline: Optional[Deadline] = None) -> bool:
+        """Wait until another request may be sent, return False if the deadline passes first"""
+        deadline = deadline or Deadline()
+        with self._condition:
+            while self._in_flight >= min(self.limit, self.max_limit):
+                if deadline.expired():
+                    return False
+                self._condition.wait(deadline.remaining())
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Mark a request as finished"""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def record_success(self, latency: float) -> Optional[int]:
+        """Account for a successful response, return the new limit if it has changed"""
+        with self._condition:
+            is_spike = self._samples >= self.LATENCY_WARMUP and latency > self.LATENCY_SPIKE_FACTOR * self._latency
+            # Spikes still enter the average, so that a lasting slowdown becomes the new normal
+            self._samples += 1
+            weight = max(self.LATENCY_WEIGHT, 1 / self._samples)
+            self._latency += weight * (latency - self._latency)
+            if is_spike:
+                return self._decrease()
+
+            old_limit = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            if self.limit == old_limit:
+                return None
+            self._condition.notify_all()
+            return self.limit
+
+    def record_congestion(self) -> Optional[int]:
+        """Account for a sign of congestion, return the new limit if it has changed"""
+        with self._condition:
+            return self._decrease()
+
+    def _decrease(self) -> Optional[int]:
+        """Cut the limit, unless it was cut within the last typical response time"""
+        now = time.monotonic()
+        if now - self._last_decrease < self._latency:
+            return None
+        self._last_decrease = now
+        old_limit = self.limit
+        self._limit = max(1.0, self._limit * self.DECREASE_FACTOR)
+        return self.limit if self.limit != old_limit else None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single call.
+
+    The first caller for a key runs the call, callers arriving while it is still running wait for it and receive its
+    result, or its exception. Results are not kept once the call has finished."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return the result of fn, sharing it with concurrent calls for the same key"""
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class LatencyTracker:
+    """Recent response times of an engine, to derive percentiles from"""
+
+    # Number of response times kept
+    WINDOW = 200
+    # Number of response times needed before percentiles are trusted
+    MIN_SAMPLES = 20
+
+    def __init__(self):
+        self._samples: Deque[float] = deque(maxlen=self.WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Add a response time in seconds"""
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, percent: float, default: float) -> float:
+        """Return the given percentile of the recent response times, or default if there are too few of them"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.MIN_SAMPLES:
+            return default
+        index = min(len(samples) - 1, int(len(samples) * percent / 100))
+        return samples[index]
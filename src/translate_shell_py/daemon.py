@@ -0,0 +1,140 @@
+import os
+import signal
+import socket
+import sys
+import traceback
+from typing import Dict, List
+
+from .cli import TranslationCLI
+from .client import (ensure_private_dir, fallback_socket_path, is_own_socket, is_supported, peer_uid, receive_message,
+                     send_exit_code)
+
+
+def _error(message: str) -> None:
+    """Print error message"""
+    print(message, file=sys.stderr)
+
+
+class TranslationDaemon:
+    """Resident translation server behind a Unix domain socket.
+
+    Engines stay initialized between requests, together with their connection pools and caches. A client passes its
+    stdin, stdout and stderr along with its arguments, and the request is run directly on them. Requests are served one
+    at a time, in the order they arrive."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.cli = TranslationCLI(resident=True)
+        self.stopping = False
+
+    def serve_forever(self) -> int:
+        """Serve requests until interrupted or terminated"""
+        if not is_supported():
+            _error('[ERROR] Daemon mode is not supported on this platform')
+            return 1
+
+        if self.socket_path == fallback_socket_path() and not ensure_private_dir(self.socket_path):
+            _error(f'[ERROR] {os.path.dirname(self.socket_path)} is not a directory private to the current user')
+            return 1
+        if os.path.lexists(self.socket_path):
+            if not is_own_socket(self.socket_path):
+                _error(f'[ERROR] {self.socket_path} exists and is not a socket of the current user')
+                return 1
+            if self._is_daemon_running():
+                _error(f'[ERROR] A daemon is already listening on {self.socket_path}')
+                return 1
+            os.unlink(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the user running the daemon may connect to it
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        signal.signal(signal.SIGTERM, self._terminate)
+        print(f'Translation daemon listening on {self.socket_path}', file=sys.stderr)
+
+        try:
+            while not self.stopping:
+                connection, _ = server.accept()
+                with connection:
+                    self.handle(connection)
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            server.close()
+            os.unlink(self.socket_path)
+            self.cli.close()
+        return 0
+
+    def handle(self, connection: socket.socket) -> None:
+        """Run a single request and report its exit code back to the client"""
+        try:
+            if peer_uid(connection) != os.getuid():
+                _error('[WARNING] Dropped request from another user')
+                return
+            _, fds, _, _ = socket.recv_fds(connection, 1, 3)
+            request = receive_message(connection)
+        except (OSError, ValueError) as e:
+            _error(f'[WARNING] Dropped malformed request: {e}')
+            return
+
+        if len(fds) != 3:
+            for fd in fds:
+                os.close(fd)
+            _error('[WARNING] Dropped request without standard streams')
+            return
+
+        exit_code = self.run_request(request['args'], request['cwd'], request['env'], fds)
+        try:
+            send_exit_code(connection, exit_code)
+        except OSError:
+            pass  # client has gone away
+
+    def run_request(self, args: List[str], cwd: str, env: Dict[str, str], fds: List[int]) -> int:
+        """Run the CLI in the environment and on the standard streams of the client"""
+        streams = [open(fds[0], 'r', closefd=True)]
+        for fd in fds[1:]:
+            # Stream output to terminals line by line, anything else is written in larger chunks
+            streams.append(open(fd, 'w', buffering=1 if os.isatty(fd) else -1, closefd=True))
+
+        saved_streams = sys.stdin, sys.stdout, sys.stderr
+        saved_cwd, saved_env = os.getcwd(), dict(os.environ)
+        sys.stdin, sys.stdout, sys.stderr = streams
+        try:
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(env)
+            exit_code = self.cli.run(args)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            for stream in streams:
+                try:
+                    stream.close()
+                except OSError:
+                    pass  # output closed by the client, e.g. a pipe into head
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+        return exit_code
+
+    def _terminate(self, signum, frame) -> None:
+        """Stop serving, after the current request if there is one"""
+        self.stopping = True
+        raise SystemExit(0)
+
+    def _is_daemon_running(self) -> bool:
+        """Check if another daemon is accepting connections on the socket"""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(self.socket_path)
+                return True
+            except OSError:
+                return False
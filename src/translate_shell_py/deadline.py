@@ -0,0 +1,34 @@
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Point in time by which some work has to be finished, or no limit at all"""
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    @staticmethod
+    def earliest(*deadlines: Optional["Deadline"]) -> "Deadline":
+        """Return the deadline that expires first"""
+        result = Deadline()
+        for deadline in deadlines:
+            if deadline and deadline.expires_at is not None and (result.expires_at is None
+                                                                 or deadline.expires_at < result.expires_at):
+                result = deadline
+        return result
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left until the deadline, or None if there is no limit"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Check if the deadline has passed"""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout: float) -> float:
+        """Shorten a timeout so that it ends by the deadline at the latest"""
+        remaining = self.remaining()
+        return timeout if remaining is None else min(timeout, remaining)
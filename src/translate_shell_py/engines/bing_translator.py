@@ -1,12 +1,18 @@
 import argparse
 import json
+import os
 import re
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import asdict, dataclass
 from typing import override
 
+from .. import json_backend
+from ..cache import default_cache_dir
+from ..deadline import Deadline
 from ..langdata import get_code, get_endonym
 from ..theme import prettify
-from ..translate import TranslationEngine, _escape_text, format_phonetics, Translation
+from ..translate import TranslationEngine, _escape_text, _warning, format_phonetics, Translation
 
 
 def first_match(pattern: str, data: str) -> re.Match | None:
@@ -45,6 +51,10 @@ class BingAccessToken:
 
         return BingAccessToken(ig, iid, session_start, token, valid_for_millis)
 
+    def expires_at(self) -> float:
+        """Return the expiry time of the token in seconds since the epoch"""
+        return (self.session_start + self.valid_for_millis) / 1000
+
 
 class BingTranslatorResponse:
     def __init__(self, content):
@@ -103,15 +113,97 @@ def _map_from_bing_lang_code(bing_code: str) -> str:
 class BingTranslatorEngine(TranslationEngine):
     """Google Translate API implementation"""
 
+    name = 'bing'
+
+    # Seconds before expiry at which the access token is renewed
+    TOKEN_REFRESH_MARGIN = 300
+    # Seconds to wait before another attempt if renewing the access token failed
+    TOKEN_REFRESH_RETRY = 30
+
     def __init__(self, options: argparse.Namespace):
         super().__init__(options)
         self.access_token: BingAccessToken | None = None
+        self.refresh_timer: threading.Timer | None = None
+        self.closed = False
 
     @override
     def initialize(self):
         """Initialize the Bing Translator engine"""
-        content = self.http_get(self.get_endpoint('gettoken'))
+        self.access_token = self.load_access_token()
+        if not self.access_token or self.access_token.expires_at() - self.TOKEN_REFRESH_MARGIN < time.time():
+            self.refresh_access_token()
+        self.schedule_token_refresh(self.access_token.expires_at() - self.TOKEN_REFRESH_MARGIN - time.time())
+
+    def refresh_access_token(self):
+        """Fetch a new access token from the translator page and store it on disk"""
+        content = self.http_get(self.get_endpoint('gettoken')).decode('utf-8', errors='replace')
         self.access_token = BingAccessToken.from_token_request_response(content)
+        self.store_access_token()
+
+    def schedule_token_refresh(self, delay: float):
+        """Renew the access token in the background after delay seconds"""
+        if self.closed:
+            return
+        if self.refresh_timer:
+            self.refresh_timer.cancel()
+        self.refresh_timer = threading.Timer(max(0.0, delay), self._refresh_in_background)
+        self.refresh_timer.daemon = True
+        self.refresh_timer.start()
+
+    def _refresh_in_background(self):
+        """Renew the access token and schedule the next renewal"""
+        try:
+            self.refresh_access_token()
+            self.schedule_token_refresh(self.access_token.expires_at() - self.TOKEN_REFRESH_MARGIN - time.time())
+        except Exception as e:
+            # Nothing is waiting for this thread to report to, and the current token may still be valid for a while:
+            # try again soon
+            if self.options.debug:
+                _warning(f'[DEBUG] Renewing the Bing access token failed, retrying in {self.TOKEN_REFRESH_RETRY}s: {e}')
+            self.schedule_token_refresh(self.TOKEN_REFRESH_RETRY)
+
+    def token_path(self) -> str | None:
+        """Return the path of the stored access token, or None if nothing may be stored on disk"""
+        if self.options.no_cache:
+            return None
+        return os.path.join(self.options.cache_dir or default_cache_dir(), 'bing-token.json')
+
+    def load_access_token(self) -> BingAccessToken | None:
+        """Load the stored access token and restore the session cookies that belong to it"""
+        path = self.token_path()
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            access_token = BingAccessToken(**stored['token'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self.transport.set_cookies(stored.get('cookies', {}))
+        return access_token
+
+    def store_access_token(self):
+        """Store the access token together with the session cookies that belong to it"""
+        path = self.token_path()
+        if not path:
+            return
+        stored = {'token': asdict(self.access_token), 'cookies': self.transport.get_cookies()}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # The session cookies are credentials, keep them private and never leave a partially written file
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            _warning(f'[WARNING] Could not store Bing access token in {path}: {e}')
+
+    @override
+    def close(self):
+        self.closed = True
+        if self.refresh_timer:
+            self.refresh_timer.cancel()
+        super().close()
 
     def get_endpoint(self, name: str) -> str:
         """Generate request URL for Bing Translator"""
@@ -140,6 +232,7 @@ class BingTranslatorEngine(TranslationEngine):
     @override
     def _translate(self, text: str, source_lang: str, target_lang: str, host_lang: str
                    , is_verbose: bool
+                   , deadline: Deadline | None = None
                    # TODO: implement these features or remove
                    #, to_speech: bool
                    #, return_playlist: Optional[List]
@@ -160,21 +253,25 @@ class BingTranslatorEngine(TranslationEngine):
         bing_code_target_lang = _map_to_bing_lang_code(code_target_lang)
 
         # Get response from Bing Translator
-        content = self.http_post(self.get_endpoint('translate'),
-                                 self.request_params(text, bing_code_source_lang, bing_code_target_lang),
-                                 content_type='application/x-www-form-urlencoded')
+        content = self.cached_request(
+            text, bing_code_source_lang, bing_code_target_lang, code_host_lang,
+            lambda: self.http_post(self.get_endpoint('translate'),
+                                   self.request_params(text, bing_code_source_lang, bing_code_target_lang),
+                                   content_type='application/x-www-form-urlencoded', deadline=deadline))
         if self.options.dump:
-            return Translation(content, '', code_target_lang, [])
+            return Translation(content.decode('utf-8', errors='replace'), '', code_target_lang, [])
 
-        content = json.loads(content)
+        content = json_backend.loads(content)
         response = BingTranslatorResponse(content)
 
         # Perform additional requests
         if self.options.show_original_phonetics:
-            content = self.http_post(self.get_endpoint('translate'),
-                                     self.request_params(text, response.identified_lang, response.identified_lang),
-                                     content_type='application/x-www-form-urlencoded')
-            content = json.loads(content)
+            content = self.cached_request(
+                text, response.identified_lang, response.identified_lang, code_host_lang,
+                lambda: self.http_post(self.get_endpoint('translate'),
+                                       self.request_params(text, response.identified_lang, response.identified_lang),
+                                       content_type='application/x-www-form-urlencoded', deadline=deadline))
+            content = json_backend.loads(content)
             response.ingest_original_phonetics_response(content)
 
         # Update source language
@@ -186,6 +283,8 @@ class BingTranslatorEngine(TranslationEngine):
         else:
             output = self.format_brief(response, is_phonetic, code_target_lang)
 
+        audio_fragments = [(response.translation['text'], code_target_lang)] if response.translation else []
+
         return Translation(output, code_source_lang, code_target_lang, audio_fragments)
 
     def format_verbose(self, response: BingTranslatorResponse, text_input: str, code_host_lang: str,
@@ -1,13 +1,49 @@
 import argparse
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import override, List, Tuple
+from functools import cached_property
+from typing import override, Iterator, List, Optional, Tuple
 
+from .. import json_backend
+from ..deadline import Deadline
 from ..langdata import get_code, get_endonym, show_definitions_of, show_translations_of
 from ..theme import prettify
 from ..translate import TranslationEngine, _escape_text, format_phonetics, Translation
 
 
+# Whitespace after the end of a sentence, the end of a sentence in full-width punctuation, or a line break
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?;:])\s+|(?<=[\u3002\uff01\uff1f\uff1b])\s*|\n+')
+
+
+def _split_text(text: str, max_length: int) -> List[str]:
+    """Split text into chunks of at most max_length characters.
+
+    Chunks end at sentence boundaries where possible, sentences that are too long on their own are split at whitespace,
+    or anywhere as a last resort. The chunks keep all characters of the text, so they join back into it."""
+    sentences, start = [], 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+
+    chunks, chunk = [], ''
+    for sentence in sentences:
+        if chunk and len(chunk) + len(sentence) > max_length:
+            chunks.append(chunk)
+            chunk = ''
+        while len(sentence) > max_length:
+            cut = max(sentence.rfind(' ', 0, max_length), sentence.rfind('\n', 0, max_length)) + 1 or max_length
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:]
+        chunk += sentence
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 @dataclass
 class DictionaryEntry:
     word: str
@@ -16,29 +52,97 @@ class DictionaryEntry:
 
 
 class GoogleTranslateResponse:
+    """Response of Google Translate. Fields are parsed on first access, so formatters only pay for what they show."""
+
     def __init__(self, content):
-        self.translations = self._parse_translations(content)
-        self.originals = self._parse_originals(content)
-        self.phonetics = self._parse_phonetics(content)
-        self.orig_phonetics = self._parse_orig_phonetics(content)
+        self.content = content
+
+    @cached_property
+    def translations(self):
+        return self._parse_translations(self.content)
+
+    @cached_property
+    def originals(self):
+        return self._parse_originals(self.content)
+
+    @cached_property
+    def phonetics(self):
+        return self._parse_phonetics(self.content)
+
+    @cached_property
+    def orig_phonetics(self):
+        return self._parse_orig_phonetics(self.content)
+
+    @cached_property
+    def dictionary(self):
+        return self._parse_dictionary(self.content)
 
-        self.dictionary = self._parse_dictionary(content)
-        self.alternatives = self._parse_alternatives(content)
+    @cached_property
+    def alternatives(self):
+        return self._parse_alternatives(self.content)
 
+    @cached_property
+    def autocorrected_input(self):
         # 7 - autocorrection
-        if content[7] is not None and len(content[7]) >= 5:
-            self.autocorrected_input = bool(content[7][5])
-            self.correction_hint = content[7][1]
-        else:
-            self.autocorrected_input = False
-            self.correction_hint = None
+        content = self.content
+        return content[7] is not None and len(content[7]) >= 5 and bool(content[7][5])
+
+    @cached_property
+    def correction_hint(self):
+        content = self.content
+        return content[7][1] if content[7] is not None and len(content[7]) >= 5 else None
+
+    @cached_property
+    def identified_langs(self):
+        return self._parse_identified_langs(self.content)
+
+    @cached_property
+    def orig_synonyms(self):
+        return self._parse_orig_synonyms(self.content)
+
+    @cached_property
+    def orig_words(self):
+        return self._parse_orig_words(self.content)
+
+    @cached_property
+    def orig_examples(self):
+        return self._parse_orig_examples(self.content)
 
-        self.identified_langs = self._parse_identified_langs(content)
-        self.orig_synonyms = self._parse_orig_synonyms(content)
-        self.orig_words = self._parse_orig_words(content)
-        self.orig_examples = self._parse_orig_examples(content)
-        self.orig_see_also = self._parse_orig_see_also(content)
-        self.gendered = self._parse_gendered(content)
+    @cached_property
+    def orig_see_also(self):
+        return self._parse_orig_see_also(self.content)
+
+    @cached_property
+    def gendered(self):
+        return self._parse_gendered(self.content)
+
+    @staticmethod
+    def split_batch_content(content, count: int) -> Optional[List[list]]:
+        """Split the content of a response to newline-joined texts into the content of one response per text.
+
+        Google keeps line breaks as segment boundaries, so each segment in content[0] belongs to exactly one of the
+        texts. Returns None if the segments do not line up with the texts."""
+        if len(content) < 1 or not content[0]:
+            return None
+
+        segments_per_text = [[]]
+        for x in content[0]:
+            # Skip segments without an original, such as the trailing transliteration of the whole request
+            if not x or len(x) < 2 or not x[1]:
+                continue
+            original = x[1]
+            if '\n' in original.rstrip('\n') or original.count('\n') > 1:
+                return None
+            translation = x[0].rstrip('\n') if x[0] else x[0]
+            segments_per_text[-1].append([translation, original.rstrip('\n'), *x[2:]])
+            if original.endswith('\n'):
+                segments_per_text.append([])
+
+        if not segments_per_text[-1]:
+            segments_per_text.pop()
+        if len(segments_per_text) != count:
+            return None
+        return [[segments, *content[1:]] for segments in segments_per_text]
 
     @staticmethod
     def _parse_translations(content):
@@ -213,23 +317,97 @@ class GoogleTranslateResponse:
 class GoogleTranslationEngine(TranslationEngine):
     """Google Translate API implementation"""
 
+    name = 'google'
+
+    # Upper bound for the URL-escaped text of a batched request
+    BATCH_MAX_QUERY_LENGTH = 4000
+    # Longer URL-escaped texts are sent in the body of a POST request instead of the URL
+    MAX_GET_QUERY_LENGTH = 4000
+    # Longer texts are split into chunks of at most this many characters, which are translated in parallel
+    CHUNK_MAX_LENGTH = 2000
+    # Response fields (dt parameters) that can be requested, see GoogleTranslateResponse for where they end up
+    ALL_FIELDS = ('bd', 'ex', 'ld', 'md', 'rw', 'rm', 'ss', 't', 'at', 'gt')
+
     def __init__(self, options: argparse.Namespace):
         super().__init__(options)
+        # Chunks are requested from here, as translations may already run on the engine's executor
+        self.chunk_executor = ThreadPoolExecutor(max_workers=max(1, options.jobs),
+                                                 thread_name_prefix=f'{self.name}-chunk')
 
     @override
     def initialize(self):
         """Initialize the Google Translate engine"""
         pass # nothing to do
 
-    def request_url(self, text: str, sl: str, tl: str, hl: str) -> str:
+    @override
+    def close(self):
+        self.chunk_executor.shutdown(cancel_futures=True)
+        super().close()
+
+    def request_fields(self, is_verbose: bool, is_phonetic: bool) -> Tuple[str, ...]:
+        """Select the response fields needed for the output, brief output only needs the translated segments"""
+        if self.options.dump:
+            return self.ALL_FIELDS
+
+        fields = ['t']
+        if is_phonetic or (is_verbose and (self.options.show_original_phonetics
+                                           or self.options.show_translation_phonetics)):
+            fields.append('rm')
+        if is_verbose or self.options.identify:
+            fields.append('ld')
+        if is_verbose:
+            if self.options.show_translation:
+                fields.append('gt')
+            if self.options.show_dictionary:
+                fields.append('bd')
+            if self.options.show_alternatives:
+                fields.append('at')
+            if self.options.show_original_dictionary:
+                fields.extend(['md', 'ss', 'ex', 'rw'])
+        return tuple(fields)
+
+    def request_url(self, text: str, sl: str, tl: str, hl: str, fields: Tuple[str, ...] = ALL_FIELDS) -> str:
         """Generate request URL for Google Translate"""
+        return f'{self.request_base_url(sl, tl, hl, fields)}&q={_escape_text(text)}'
+
+    def request_base_url(self, sl: str, tl: str, hl: str, fields: Tuple[str, ...] = ALL_FIELDS) -> str:
+        """Generate request URL for Google Translate, without the text to translate"""
         qc = 'qc' if self.options.no_autocorrect else 'qca'
 
         return (f'http://translate.googleapis.com/translate_a/single?client=gtx'
                 f'&ie=UTF-8&oe=UTF-8'
-                f'&dt=bd&dt=ex&dt=ld&dt=md&dt=rw&dt=rm&dt=ss&dt=t&dt=at&dt=gt'
-                f'&dt={qc}&sl={sl}&tl={tl}&hl={hl}'
-                f'&q={_escape_text(text)}')
+                f'{"".join(f"&dt={field}" for field in fields)}'
+                f'&dt={qc}&sl={sl}&tl={tl}&hl={hl}')
+
+    def request_translation(self, text: str, sl: str, tl: str, hl: str, fields: Tuple[str, ...] = ALL_FIELDS,
+                            deadline: Optional[Deadline] = None) -> bytes:
+        """Send a translation request for text, as a POST request if the text would make the URL too long"""
+        query = _escape_text(text)
+        if len(query) <= self.MAX_GET_QUERY_LENGTH:
+            return self.http_get(self.request_url(text, sl, tl, hl, fields), deadline)
+        return self.http_post(self.request_base_url(sl, tl, hl, fields), f'q={query}',
+                              content_type='application/x-www-form-urlencoded;charset=utf-8', deadline=deadline)
+
+    def fetch_content(self, text: str, sl: str, tl: str, hl: str, fields: Tuple[str, ...] = ALL_FIELDS,
+                      deadline: Optional[Deadline] = None) -> bytes:
+        """Return the raw response for text, splitting long texts into chunks that are requested in parallel.
+
+        The contents of the chunk responses are merged into the content of a single response: the translated segments
+        of all chunks follow each other, everything else is taken from the first chunk."""
+        chunks = _split_text(text, self.CHUNK_MAX_LENGTH) if len(text) > self.CHUNK_MAX_LENGTH else [text]
+        if len(chunks) == 1:
+            return self.cached_request(text, sl, tl, hl,
+                                       lambda: self.request_translation(text, sl, tl, hl, fields, deadline), fields)
+
+        def fetch_chunk(chunk: str) -> list:
+            return json_backend.loads(self.cached_request(chunk, sl, tl, hl,
+                                                  lambda: self.request_translation(chunk, sl, tl, hl, fields, deadline),
+                                                  fields))
+
+        contents = list(self.chunk_executor.map(fetch_chunk, chunks))
+        merged = contents[0]
+        merged[0] = [segment for content in contents if content and content[0] for segment in content[0]]
+        return json.dumps(merged, ensure_ascii=False).encode('utf-8')
 
     @override
     def tts_url(self, text: str, lang: str) -> str:
@@ -246,6 +424,7 @@ class GoogleTranslationEngine(TranslationEngine):
     @override
     def _translate(self, text: str, source_lang: str, target_lang: str, host_lang: str
                    , is_verbose: bool = False
+                   , deadline: Optional[Deadline] = None
                    #, to_speech: bool = False
                    #, return_playlist: Optional[List] = None
                    #, return_il: Optional[List] = None
@@ -263,13 +442,13 @@ class GoogleTranslationEngine(TranslationEngine):
         code_host_lang = get_code(host_lang) or host_lang
 
         # Get response from Google Translate
-        url = self.request_url(text, code_source_lang, code_target_lang, code_host_lang)
-        content = self.http_get(url)
+        content = self.fetch_content(text, code_source_lang, code_target_lang, code_host_lang,
+                                     self.request_fields(is_verbose, is_phonetic), deadline)
 
         if self.options.dump:
-            return Translation(content, '', code_target_lang, [])
+            return Translation(content.decode('utf-8', errors='replace'), '', code_target_lang, [])
 
-        content = json.loads(content)
+        content = json_backend.loads(content)
         response = GoogleTranslateResponse(content)
 
         # Set identified language
@@ -289,6 +468,74 @@ class GoogleTranslationEngine(TranslationEngine):
 
         return Translation(output, code_source_lang, code_target_lang, audio_fragments)
 
+    @override
+    def _translate_batch(self, texts: List[str], source_lang: str, target_lang: str, host_lang: str,
+                         deadline: Optional[Deadline] = None) -> List[Translation]:
+        """Translate several texts with as few requests as possible.
+
+        The texts are joined by line breaks and sent in one request, the translated segments are then split back onto
+        the texts. Texts of a request whose segments do not line up are translated one by one instead."""
+        # Phonetics are only returned for the request as a whole and cannot be split between texts
+        if target_lang.startswith('@'):
+            return super()._translate_batch(texts, source_lang, target_lang, host_lang, deadline)
+
+        # Convert language codes
+        code_source_lang = get_code(source_lang) or source_lang
+        code_target_lang = get_code(target_lang) or target_lang
+        code_host_lang = get_code(host_lang) or host_lang
+
+        translations = []
+        for packed_texts in self._pack_texts(texts):
+            packed_translations = None
+            if len(packed_texts) > 1:
+                packed_translations = self._translate_packed(packed_texts, code_source_lang, code_target_lang,
+                                                             code_host_lang, deadline)
+            if packed_translations is None:
+                packed_translations = super()._translate_batch(packed_texts, source_lang, target_lang, host_lang,
+                                                               deadline)
+            translations.extend(packed_translations)
+        return translations
+
+    def _pack_texts(self, texts: List[str]) -> Iterator[List[str]]:
+        """Group consecutive texts so that each group fits into a single request"""
+        packed_texts, length = [], 0
+        for text in texts:
+            text_length = len(_escape_text(text)) + len(_escape_text('\n'))
+            if packed_texts and length + text_length > self.BATCH_MAX_QUERY_LENGTH:
+                yield packed_texts
+                packed_texts, length = [], 0
+            packed_texts.append(text)
+            length += text_length
+        if packed_texts:
+            yield packed_texts
+
+    def _translate_packed(self, texts: List[str], code_source_lang: str, code_target_lang: str, code_host_lang: str,
+                          deadline: Optional[Deadline] = None) -> Optional[List[Translation]]:
+        """Translate newline-joined texts in a single request, return None if the response cannot be split"""
+        text = '\n'.join(texts)
+        fields = self.request_fields(False, False)
+        content = self.cached_request(text, code_source_lang, code_target_lang, code_host_lang,
+                                      lambda: self.request_translation(text, code_source_lang, code_target_lang,
+                                                                       code_host_lang, fields, deadline),
+                                      fields)
+        content = json_backend.loads(content)
+        identified_langs = GoogleTranslateResponse._parse_identified_langs(content)
+        if code_source_lang == 'auto' and len(identified_langs) >= 1:
+            code_source_lang = identified_langs[0]
+
+        contents = GoogleTranslateResponse.split_batch_content(content, len(texts))
+        if contents is None:
+            return None
+
+        translations = []
+        for text_content in contents:
+            response = GoogleTranslateResponse(text_content)
+            output = self.format_brief(response, False)
+            audio_fragments = self.compile_audio_fragments(response, False, code_host_lang, code_source_lang,
+                                                           code_target_lang)
+            translations.append(Translation(output, code_source_lang, code_target_lang, audio_fragments))
+        return translations
+
     def format_verbose(self, response: GoogleTranslateResponse, code_host_lang, code_source_lang, code_target_lang) -> str:
         """Format engine response verbosely"""
         result_parts = []
@@ -399,3 +646,54 @@ class GoogleTranslationEngine(TranslationEngine):
                 fragments.append((' '.join(response.originals), code_source_lang))
         fragments.append((', '.join(response.translations), code_target_lang))
         return fragments
+
+
+if __name__ == "__main__":
+    # Benchmark brief against verbose output for a verbose response, per response from the raw body to the output.
+    # Brief output only parses the translated segments, verbose output parses every field it shows.
+    import timeit
+    from ..cli import parse_args
+    payload = (  # translate_a/single, en -> de, q=run, every dt field
+        '[[["Lauf","run",null,null,10],[null,null,"lauf","rən"]],[["verb",["laufen","rennen","betreiben","ausführen",'
+        '"verlaufen","fahren","führen","leiten"],[["laufen",["run","walk","go","flow","proceed","operate"],null,0.37],'
+        '["rennen",["run","race","dash","rush","hurry"],null,0.21],["betreiben",["operate","run","conduct","pursue",'
+        '"carry on","drive"],null,0.066],["ausführen",["execute","perform","carry out","run","implement","export"],'
+        'null,0.052],["verlaufen",["run","go","proceed","pass","extend","take its course"],null,0.012],["fahren",'
+        '["drive","go","run","ride","travel","sail"],null,0.0094],["führen",["lead","guide","run","manage","conduct",'
+        '"keep"],null,0.0071],["leiten",["direct","manage","run","conduct","head","lead"],null,0.0058]],"run",2],'
+        '["noun",["Lauf","Fahrt","Serie","Ansturm","Auflage","Laufmasche"],[["Lauf",["run","course","barrel","race",'
+        '"operation","running"],null,0.11,"der"],["Fahrt",["ride","drive","trip","journey","run","travel"],null,0.0079,'
+        '"die"],["Serie",["series","serial","run","range","streak","line"],null,0.0041,"die"],["Ansturm",["rush",'
+        '"onslaught","run","assault","storm","surge"],null,0.0019,"der"],["Auflage",["edition","condition","run",'
+        '"circulation","print run","requirement"],null,0.0012,"die"],["Laufmasche",["ladder","run"],null,0.00031,'
+        '"die"]],"run",1]],"en",null,null,[["run",null,[["Lauf",1000,true,false,[10]],["laufen",0,true,false,[8]],'
+        '["Run",0,true,false,[8]]],[[0,3]],"run",0,0]],1,[],[["en"],null,[1],["en"]],null,null,[["verb",[[["sprint",'
+        '"race","dash","hurry","scurry","scamper","gallop","jog"],"m_en_gbus0886280.005"],[["manage","be in charge of",'
+        '"direct","control","head","lead","administer"],"m_en_gbus0886280.022"],[["operate","function","work","go",'
+        '"perform"],"m_en_gbus0886280.028"]],"run"],["noun",[[["sprint","race","dash","gallop","jog","trot"],'
+        '"m_en_gbus0886280.065"],[["series","sequence","succession","chain","string","streak"],'
+        '"m_en_gbus0886280.080"]],"run"]],[["verb",[["move at a speed faster than a walk, never having both or all the '
+        'feet on the ground at the same time.","m_en_gbus0886280.005","the dog ran across the road"],["be in charge '
+        'of; manage.","m_en_gbus0886280.022","Andrea runs her own catering business"],["(of a machine or system) be '
+        'operating or functioning.","m_en_gbus0886280.028","the car runs on unleaded fuel"]],"run"],["noun",[["an '
+        'act or spell of running.","m_en_gbus0886280.065","I usually go for a run in the morning"],["a continuous '
+        'spell of a particular situation or condition.","m_en_gbus0886280.080","he\'s had a run of bad luck"]],"run"]],'
+        '[[["the dog <b>ran</b> across the road",null,null,null,3,"m_en_gbus0886280.005"],["Andrea <b>runs</b> her own '
+        'catering business",null,null,null,3,"m_en_gbus0886280.022"],["I usually go for a <b>run</b> in the morning",'
+        'null,null,null,3,"m_en_gbus0886280.065"],["he\'s had a <b>run</b> of bad luck",null,null,null,3,'
+        '"m_en_gbus0886280.080"]]],[["run away","run out","runs","running","run into","run up"]]]'
+    ).encode('utf-8')
+    engine = GoogleTranslationEngine(parse_args(['-no-cache']))
+
+    def brief():
+        return engine.format_brief(GoogleTranslateResponse(json_backend.loads(payload)), False)
+
+    def verbose():
+        return engine.format_verbose(GoogleTranslateResponse(json_backend.loads(payload)), 'en', 'en', 'de')
+
+    number = 2000
+    print(f"Formatting a {len(payload) / 1024:.1f} KiB verbose response, JSON backend: {json_backend.BACKEND}")
+    for name, output in (('brief', brief), ('verbose', verbose)):
+        seconds = min(timeit.repeat(output, number=number, repeat=5)) / number
+        print(f"{name:>8}: {seconds * 1e6:.1f} us")
+    engine.close()
@@ -66,6 +66,8 @@ class InteractiveShell:
 
             if user_input:
                 translation = self.cli.engine.translate(user_input, self.cli.options.source_lang)
+                # Each translation gets its own pager session
+                self.cli.engine.close_output()
                 #print(translation.)
 
         print("Interactive mode would be implemented here")
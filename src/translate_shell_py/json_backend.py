@@ -0,0 +1,119 @@
+# JSON decoding of engine responses.
+#
+# Responses are decoded straight from the raw bytes of the HTTP body, with the fastest parser that is installed:
+# orjson, then pysimdjson, then the standard library. All of them return plain lists, dicts and strings.
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _select_backend() -> tuple[str, Callable[[Union[bytes, str]], Any]]:
+    """Return the name and the decoding function of the fastest available JSON parser"""
+    if orjson is not None:
+        return 'orjson', orjson.loads
+    if simdjson is not None:
+        return 'simdjson', simdjson.loads
+    # Detects the UTF encoding of bytes itself
+    return 'json', json.loads
+
+
+BACKEND, loads = _select_backend()
+
+
+if __name__ == "__main__":
+    # Benchmark decoding engine responses with each installed parser, and the old path through str. The responses are
+    # in the wire format of each endpoint: compact UTF-8 JSON as sent over HTTP.
+    import timeit
+    google_verbose = (  # translate_a/single, en -> fr, q=light, every dt field
+        '[[["lumière","light",null,null,10],[null,null,null,"līt"]],[["noun",["lumière","éclairage","lampe","feu",'
+        '"jour","clarté"],[["lumière",["light","daylight","lamp"],null,0.61,"la"],["éclairage",["lighting","light",'
+        '"illumination"],null,0.048,"l\'"],["lampe",["lamp","light","bulb","torch"],null,0.011,"la"],["feu",["fire",'
+        '"light","heat","flame","traffic light"],null,0.0061,"le"],["jour",["day","daytime","daylight","light","date",'
+        '"opening"],null,0.0031,"le"],["clarté",["clarity","brightness","light","lightness","clearness"],null,0.0019,'
+        '"la"]],"light",1],["adjective",["léger","clair","lumineux","pâle"],[["léger",["light","slight","lightweight",'
+        '"mild","minor","soft"],null,0.32],["clair",["clear","light","plain","bright","obvious","evident"],null,0.11],'
+        '["lumineux",["bright","luminous","light","brilliant","shining","radiant"],null,0.0071],["pâle",["pale",'
+        '"pallid","light","wan","dim"],null,0.0032]],"light",3],["verb",["allumer","éclairer","illuminer"],[["allumer",'
+        '["turn on","light","switch on","ignite","kindle"],null,0.054],["éclairer",["light","illuminate","enlighten",'
+        '"brighten","shed light on"],null,0.032],["illuminer",["illuminate","light","brighten","floodlight"],null,'
+        '0.0018]],"light",2]],"en",null,null,[["light",null,[["lumière",1000,true,false,[10]],["la lumière",0,true,'
+        'false,[3]],["léger",0,true,false,[8]]],[[0,5]],"light",0,0]],0.95,[],[["en"],null,[0.95],["en"]],null,null,'
+        '[["noun",[[["illumination","brightness","luminescence","luminosity","radiance"],"m_en_gbus0575460.006"],'
+        '[["lamp","torch","flashlight","lantern","beacon"],"m_en_gbus0575460.016"]],"light"],["adjective",[[["bright",'
+        '"well lit","sunny","airy"],"m_en_gbus0575460.035"],[["lightweight","portable","slight","flimsy"],'
+        '"m_en_gbus0575460.048"]],"light"]],[["noun",[["the natural agent that stimulates sight and makes things '
+        'visible.","m_en_gbus0575460.006","the light of the sun"],["a source of illumination, especially an electric '
+        'lamp.","m_en_gbus0575460.016","a light came on in his room"]],"light"],["adjective",[["having a considerable '
+        'or sufficient amount of natural light; not dark.","m_en_gbus0575460.035","the kitchen was light and airy"],'
+        '["of little weight; not heavy.","m_en_gbus0575460.048","they were light enough to carry"]],"light"],["verb",'
+        '[["provide with light or lighting; illuminate.","m_en_gbus0575460.055","the room was lit by a number of '
+        'small lamps"]],"light"]],[[["the <b>light</b> of the sun",null,null,null,3,"m_en_gbus0575460.006"],["a <b>'
+        'light</b> came on in his room",null,null,null,3,"m_en_gbus0575460.016"],["they were <b>light</b> enough to '
+        'carry",null,null,null,3,"m_en_gbus0575460.048"]]],[["light up","light bulb","lights","lighter","lighting"]]]'
+    )
+    bing_translate = (  # ttranslatev3, auto-detect -> ja, a short paragraph
+        '[{"detectedLanguage":{"language":"en","score":1.0},"translations":[{"text":'
+        '"翻訳は、ある言語のテキストの意味を別の言語で伝えることです。'
+        '機械翻訳は、文脈を考慮しながら文全体を一度に処理します。","transliteration":{"text":'
+        '"hon\'yaku wa, aru gengo no tekisuto no imi o betsu no gengo de tsutaeru kotodesu. Kikai hon\'yaku wa, '
+        'bunmyaku o kōryo shinagara bun zentai o ichido ni shori shimasu.","script":"Latn"},"to":"ja","sentLen":'
+        '{"srcSentLen":'
+        '[79,80],"transSentLen":[32,31]}}]}]'
+    )
+    bing_lookup = (  # tlookupv3, en -> de, text=run
+        '[{"normalizedSource":"run","displaySource":"run","translations":[{"normalizedTarget":"laufen",'
+        '"displayTarget":"laufen","posTag":"VERB","confidence":0.2934,"prefixWord":"","backTranslations":['
+        '{"normalizedText":"run","displayText":"run","numExamples":15,"frequencyCount":2463},{"normalizedText":"walk",'
+        '"displayText":"walk","numExamples":15,"frequencyCount":1271},{"normalizedText":"go","displayText":"go",'
+        '"numExamples":15,"frequencyCount":692}]},{"normalizedTarget":"ausführen","displayTarget":"ausführen",'
+        '"posTag":"VERB","confidence":0.1416,"prefixWord":"","backTranslations":[{"normalizedText":"run",'
+        '"displayText":"run","numExamples":15,"frequencyCount":1012},{"normalizedText":"execute","displayText":'
+        '"execute","numExamples":15,"frequencyCount":954},{"normalizedText":"perform","displayText":"perform",'
+        '"numExamples":15,"frequencyCount":461}]},{"normalizedTarget":"betreiben","displayTarget":"betreiben",'
+        '"posTag":"VERB","confidence":0.1104,"prefixWord":"","backTranslations":[{"normalizedText":"operate",'
+        '"displayText":"operate","numExamples":15,"frequencyCount":3360},{"normalizedText":"run","displayText":"run",'
+        '"numExamples":15,"frequencyCount":1587}]},{"normalizedTarget":"lauf","displayTarget":"Lauf","posTag":"NOUN",'
+        '"confidence":0.0845,"prefixWord":"","backTranslations":[{"normalizedText":"run","displayText":"run",'
+        '"numExamples":15,"frequencyCount":433},{"normalizedText":"course","displayText":"course","numExamples":15,'
+        '"frequencyCount":398}]},{"normalizedTarget":"rennen","displayTarget":"rennen","posTag":"VERB","confidence":'
+        '0.0612,"prefixWord":"","backTranslations":[{"normalizedText":"run","displayText":"run","numExamples":15,'
+        '"frequencyCount":381},{"normalizedText":"race","displayText":"race","numExamples":15,'
+        '"frequencyCount":264}]}]}]'
+    )
+    bing_examples = (  # texamplev3, en -> de, text=run, translation=laufen
+        '[{"normalizedSource":"run","normalizedTarget":"laufen","examples":[{"sourcePrefix":"I ","sourceTerm":"run",'
+        '"sourceSuffix":" every morning before work.","targetPrefix":"Ich ","targetTerm":"laufe","targetSuffix":'
+        '" jeden Morgen vor der Arbeit."},{"sourcePrefix":"The children ","sourceTerm":"ran","sourceSuffix":" across '
+        'the street.","targetPrefix":"Die Kinder ","targetTerm":"liefen","targetSuffix":" über die Straße."},'
+        '{"sourcePrefix":"How long does the program ","sourceTerm":"run","sourceSuffix":"?","targetPrefix":"Wie lange '
+        '","targetTerm":"läuft","targetSuffix":" das Programm?"},{"sourcePrefix":"She ","sourceTerm":"runs",'
+        '"sourceSuffix":" ten kilometres a week.","targetPrefix":"Sie ","targetTerm":"läuft","targetSuffix":" zehn '
+        'Kilometer pro Woche."},{"sourcePrefix":"We had to ","sourceTerm":"run","sourceSuffix":" to catch the train.",'
+        '"targetPrefix":"Wir mussten ","targetTerm":"laufen","targetSuffix":", um den Zug zu erreichen."},'
+        '{"sourcePrefix":"","sourceTerm":"Running","sourceSuffix":" is good for your health.","targetPrefix":"",'
+        '"targetTerm":"Laufen","targetSuffix":" ist gut für die Gesundheit."}]}]'
+    )
+    corpus = {'google verbose': google_verbose, 'bing translate': bing_translate, 'bing lookup': bing_lookup,
+              'bing examples': bing_examples}
+    number = 2000
+    print(f"Selected backend: {BACKEND}")
+    for label, payload in corpus.items():
+        response = payload.encode('utf-8')
+        decoders = {'str + json': lambda: json.loads(response.decode('utf-8')), 'json': lambda: json.loads(response)}
+        if simdjson is not None:
+            decoders['simdjson'] = lambda: simdjson.loads(response)
+        if orjson is not None:
+            decoders['orjson'] = lambda: orjson.loads(response)
+        print(f"{label} ({len(response) / 1024:.1f} KiB):")
+        for name, decode in decoders.items():
+            seconds = min(timeit.repeat(decode, number=number, repeat=5)) / number
+            print(f"{name:>12}: {seconds * 1e6:.1f} us")
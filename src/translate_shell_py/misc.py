@@ -1,7 +1,9 @@
+import argparse
 import re
-import subprocess
 from typing import List, Optional, Dict
 
+from .probe import first_available
+
 
 def _get_user_lang() -> str:
     """Get user language from system (placeholder)"""
@@ -48,31 +50,6 @@ def _parse_shortcut_format(arg: str) -> Optional[Dict[str, List[str]]]:
     return None
 
 
-def detect_pager() -> Optional[str]:
+def detect_pager(options: Optional[argparse.Namespace] = None) -> Optional[str]:
     """Detect external terminal pager (less, more, most)"""
-    try:
-        subprocess.run(['less', '-V'], stdout=subprocess.DEVNULL,
-                       stderr=subprocess.DEVNULL, check=True)
-        return 'less'
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        try:
-            subprocess.run(['more', '-V'], stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL, check=True)
-            return 'more'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                subprocess.run(['most'], stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL, check=True)
-                return 'most'
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return None
-
-
-def _has_fribidi() -> bool:
-    """Check if FriBidi is available"""
-    try:
-        subprocess.run(['fribidi', '--version'],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return first_available(['less', 'more', 'most'], options)
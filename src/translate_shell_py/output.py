@@ -0,0 +1,80 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import Optional, TextIO
+
+from .misc import detect_pager
+
+
+class OutputSink:
+    """Destination of the output of a run, opened on the first write and kept open until closed.
+
+    With --view, all output is fed incrementally to a single pager process. Otherwise it goes to the output file, which
+    is opened once and written through a buffer, or to the output stream."""
+
+    def __init__(self, options: argparse.Namespace):
+        self.options: argparse.Namespace = options
+        self.stream: Optional[TextIO] = None
+        self.pager_process: Optional[subprocess.Popen] = None
+        self.owns_stream = False
+
+    def write(self, string: str) -> None:
+        """Write a string followed by a line break"""
+        if self.stream is None:
+            self._open()
+
+        try:
+            self.stream.write(string + '\n')
+            # Let the pager show each piece of output as soon as it is complete
+            if self.pager_process:
+                self.stream.flush()
+        except BrokenPipeError:
+            if not self.pager_process:
+                raise
+            # The pager has been quit, the remaining output is discarded
+            self.stream = open(os.devnull, 'w')
+
+    def close(self) -> None:
+        """Flush all output and wait for the pager to be quit"""
+        if self.stream is None:
+            return
+
+        try:
+            if self.pager_process or self.owns_stream:
+                self.stream.close()
+            else:
+                self.stream.flush()
+        except BrokenPipeError:
+            pass
+        if self.pager_process:
+            self.pager_process.wait()
+
+        self.stream = None
+        self.pager_process = None
+        self.owns_stream = False
+
+    def _open(self) -> None:
+        """Start the pager, or open the output file or stream"""
+        if self.options.view:
+            pager = self.options.pager or detect_pager(self.options)
+            if pager:
+                pager_cmd = pager.split()
+                if pager == 'less':
+                    pager_cmd.append('-R')
+                try:
+                    # The standard streams are given explicitly, under the daemon they are the client's rather than the
+                    # process' own
+                    self.pager_process = subprocess.Popen(pager_cmd, stdin=subprocess.PIPE, stdout=sys.stdout,
+                                                          stderr=sys.stderr, text=True)
+                    self.stream = self.pager_process.stdin
+                    return
+                except OSError:
+                    pass  # fall back to the regular output
+
+        output_file = self.options.output or sys.stdout
+        if hasattr(output_file, 'write'):
+            self.stream = output_file
+        else:
+            self.stream = open(output_file, 'a', encoding='utf-8')
+            self.owns_stream = True
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any
 
 
 NULLSTR = ''
@@ -11,22 +11,6 @@ def belongs_to(char: str, char_list: List[str]) -> bool:
     return char in char_list
 
 
-def starts_with_any(string: str, patterns: List[str]) -> Optional[str]:
-    """Check if string starts with any of the patterns, return the matching pattern."""
-    for pattern in patterns:
-        if string.startswith(pattern):
-            return pattern
-    return None
-
-
-def matches_any(string: str, patterns: List[str]) -> Optional[str]:
-    """Check if string matches any of the regex patterns, return the matching pattern."""
-    for pattern in patterns:
-        if re.match(f"^{pattern}", string):
-            return pattern
-    return None
-
-
 def unparameterize(token: str) -> str:
     """Remove quotes from a token if it's quoted."""
     if len(token) >= 2 and token[0] == token[-1] and token[0] in ['"', "'"]:
@@ -46,6 +30,22 @@ def is_numeric(value: Any) -> bool:
 
 
 
+# Lexer for tokenize(). At each position the first matching alternative wins, which mirrors the order of checks in
+# the character-by-character scanner of the AWK original:
+#   whitespace and newlines, double-quoted strings (with backslash escapes), block comments (Lisp, C, ML style),
+#   line comments (Lisp, C++, hash style), reserved operators, numbers, and finally any other character, which is
+#   part of a plain token. Unterminated strings and block comments extend to the end of the input.
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<space>[ \t\v\n\r]+)
+  | (?P<string>"(?:[^"\\]|\\[\s\S]?)*"?)
+  | (?P<block_comment>(?:\#\||/\*|\(\*)[\s\S]*?(?:\|\#|\*/|\*\)|\Z))
+  | (?P<line_comment>(?:;|//|\#)[^\n\r]*[\n\r]?)
+  | (?P<operator>[()\[\]{},])
+  | (?P<number>[+-]?(?:(?:0|[1-9][0-9]*)|[.][0-9]*|(?:0|[1-9][0-9]*)[.][0-9]*)(?:[Ee][+-]?[0-9]+)?)
+  | (?P<plain>[^ \t\v\n\r"\#/(;)\[\]{},0-9+\-.]+|[\s\S])
+""", re.VERBOSE)
+
+
 def tokenize(string: str) -> List[str]:
     """
     Tokenize a string and return a token list.
@@ -56,123 +56,29 @@ def tokenize(string: str) -> List[str]:
     Returns:
         List of tokens
     """
-    delimiters: Optional[List[str]] = [" ", "\t", "\v"]  # whitespace, horizontal tab, vertical tab
-    newlines: Optional[List[str]] = ["\n", "\r"]  # line feed, carriage return
-    quotes: Optional[List[str]] = ['"']  # double quote
-    escape_chars: Optional[List[str]] = ["\\"]  # backslash
-    left_block_comments: Optional[List[str]] = ["#|", "/*", "(*"]  # Lisp, C, ML style
-    right_block_comments: Optional[List[str]] = ["|#", "*/", "*)"]  # Lisp, C, ML style
-    line_comments: Optional[List[str]] = [";", "//", "#"]  # Lisp, C++, hash style
-    reserved_operators: Optional[List[str]] = ["(", ")", "[", "]", "{", "}", ","]
-    reserved_patterns: Optional[List[str]] = [
-        r"[+-]?((0|[1-9][0-9]*)|[.][0-9]*|(0|[1-9][0-9]*)[.][0-9]*)([Ee][+-]?[0-9]+)?",  # scientific notation
-        r"[+-]?0[0-7]+([.][0-7]*)?",  # octal
-        r"[+-]?0[Xx][0-9A-Fa-f]+([.][0-9A-Fa-f]*)?",  # hexadecimal
-    ]
-
     tokens = []
-    s = list(string)  # Split string into characters
-    current_token = ""
-    quoting = escaping = block_commenting = line_commenting = False
-    i = 0
-
-    while i < len(s):
-        c = s[i]
-        r = string[i:]  # Remaining string from position i
-
-        if block_commenting:
-            temp_string = starts_with_any(r, right_block_comments)
-            if temp_string:
-                block_commenting = False  # block comment ends
-                i += len(temp_string)
-            else:
-                i += 1
-
-        elif line_commenting:
-            if belongs_to(c, newlines):
-                line_commenting = False  # line comment ends
-            i += 1
-
-        elif quoting:
-            current_token += c
-
-            if escaping:
-                escaping = False  # escape ends
-            else:
-                if belongs_to(c, quotes):
-                    # Finish the current token
-                    if current_token:
-                        tokens.append(current_token)
-                        current_token = ""
-                    quoting = False  # quotation ends
-                elif belongs_to(c, escape_chars):
-                    escaping = True  # escape begins
-
-            i += 1
+    current_token = []  # pieces of the plain token being read
 
-        else:
-            if belongs_to(c, delimiters) or belongs_to(c, newlines):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                i += 1
-
-            elif belongs_to(c, quotes):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                current_token = c
-                quoting = True  # quotation begins
-                i += 1
-
-            elif temp_string := starts_with_any(r, left_block_comments):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                block_commenting = True  # block comment begins
-                i += len(temp_string)
-
-            elif temp_string := starts_with_any(r, line_comments):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                line_commenting = True  # line comment begins
-                i += len(temp_string)
-
-            elif temp_string := starts_with_any(r, reserved_operators):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                # Reserve token
-                tokens.append(temp_string)
-                i += len(temp_string)
-
-            elif temp_pattern := matches_any(r, reserved_patterns):
-                # Finish the current token
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                # Reserve token
-                match = re.match(f"^{temp_pattern}", r)
-                if match:
-                    matched_text = match.group(0)
-                    tokens.append(matched_text)
-                    i += len(matched_text)
-                else:
-                    i += 1
+    # Every position matches one of the alternatives, so the matches cover the whole string
+    for match in _TOKEN_PATTERN.finditer(string):
+        kind = match.lastgroup
+        if kind == 'plain':
+            # Continue with the current token
+            current_token.append(match.group())
+            continue
 
-            else:
-                # Continue with the current token
-                current_token += c
-                i += 1
+        # Finish the current token
+        if current_token:
+            tokens.append(''.join(current_token))
+            current_token = []
+
+        # Reserve token
+        if kind == 'string' or kind == 'operator' or kind == 'number':
+            tokens.append(match.group())
 
     # Finish the last token
     if current_token:
-        tokens.append(current_token)
+        tokens.append(''.join(current_token))
 
     return tokens
 
@@ -344,3 +250,11 @@ if __name__ == "__main__":
     sexpr_tokens = ["(", "add", "1", "2", ")"]
     sexpr_ast = parse_list(sexpr_tokens)
     print("S-expr AST:", sexpr_ast)
+
+    # Benchmark tokenization of a multi-megabyte input
+    import time
+    unit = '(set "sl" "en") ; comment\n[1, 2.5, -3e4, 0x1F] /* block */ {"key": "value \\" esc"} word+other\n'
+    large_string = unit * (4_000_000 // len(unit))
+    start = time.perf_counter()
+    out = tokenize(large_string)
+    print(f"Tokenized {len(large_string) / 1e6:.1f} MB into {len(out)} tokens in {time.perf_counter() - start:.2f} s")
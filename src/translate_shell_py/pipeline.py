@@ -0,0 +1,23 @@
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Deque, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def ordered_map(fn: Callable[[T], R], items: Iterable[T], executor: Executor, buffer_size: int) -> Iterator[R]:
+    """Apply fn to items on the executor and yield the results in input order.
+
+    Items are pulled from the iterable lazily. Finished results wait in a reorder buffer of at most buffer_size entries
+    until all results before them have been yielded, so memory use does not depend on the length of the input. The
+    number of concurrent calls of fn is bounded by the executor."""
+    buffer: Deque[Future] = deque()
+    for item in items:
+        buffer.append(executor.submit(fn, item))
+        # Emit whatever is ready at the head of the buffer, block only when it is full
+        while buffer and (buffer[0].done() or len(buffer) >= buffer_size):
+            yield buffer.popleft().result()
+
+    while buffer:
+        yield buffer.popleft().result()
@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .cache import default_cache_dir
+
+# Command that has to succeed for each external program to count as available
+PROBE_COMMANDS: Dict[str, List[str]] = {
+    'less': ['less', '-V'],
+    'more': ['more', '-V'],
+    'most': ['most'],
+    'mpv': ['mpv'],
+    'mplayer': ['mplayer'],
+    'mpg123': ['mpg123', '--version'],
+}
+
+_results: Dict[Tuple[str, str], bool] = {}
+_lock = threading.Lock()
+
+
+def _probe_cache_path(options: Optional[argparse.Namespace]) -> Optional[str]:
+    """Return the path of the file that keeps probe results between runs, or None if nothing may be stored on disk"""
+    if options is None or options.no_cache:
+        return None
+    return os.path.join(options.cache_dir or default_cache_dir(), 'probes.json')
+
+
+def _load_stored(path: str) -> dict:
+    """Read the probe results of earlier runs"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            stored = json.load(f)
+        return stored if isinstance(stored, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _store(path: str, stored: dict) -> None:
+    """Write the probe results for later runs, failures only mean probing again next time"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _run_probe(name: str) -> bool:
+    """Run the probe command of a program"""
+    try:
+        return subprocess.run(PROBE_COMMANDS[name], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL).returncode == 0
+    except OSError:
+        return False
+
+
+def is_available(name: str, options: Optional[argparse.Namespace] = None) -> bool:
+    """Check if an external program is available and working.
+
+    The check runs at most once per process and search path. Unless options disable caching, its result is also kept in
+    the cache directory, keyed by the search path and by the location and modification time of the program, so later
+    runs only need to look the program up."""
+    search_path = os.environ.get('PATH', os.defpath)
+    with _lock:
+        if (name, search_path) in _results:
+            return _results[name, search_path]
+
+        executable = shutil.which(name, path=search_path)
+        if executable is None:
+            # Not installed, there is nothing to run
+            available = False
+        else:
+            try:
+                mtime = os.stat(executable).st_mtime
+            except OSError:
+                mtime = None
+            key = f'{search_path}\0{executable}\0{mtime}'
+            path = _probe_cache_path(options)
+            stored = _load_stored(path) if path else {}
+            entry = stored.get(name)
+            if isinstance(entry, dict) and entry.get('key') == key:
+                available = bool(entry.get('available'))
+            else:
+                available = _run_probe(name)
+                if path:
+                    stored[name] = {'key': key, 'available': available}
+                    _store(path, stored)
+
+        _results[name, search_path] = available
+        return available
+
+
+def first_available(names: List[str], options: Optional[argparse.Namespace] = None) -> Optional[str]:
+    """Return the first of the programs that is available, or None"""
+    return next((name for name in names if is_available(name, options)), None)
@@ -0,0 +1,100 @@
+import argparse
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+from .cache import default_cache_dir
+from .deadline import Deadline
+
+# Bucket state: number of available tokens and the time they were counted at
+_STATE = struct.Struct('=dd')
+
+
+def _warning(message: str) -> None:
+    """Print warning message"""
+    print(message, file=sys.stderr)
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate of an engine, shared by all local processes.
+
+    The bucket refills at `rate` tokens per second up to `burst` tokens, and every request takes one token. Its state is
+    kept in a small file under an exclusive lock, so concurrent runs draw from one common budget. A request that finds
+    the bucket empty reserves the next token anyway and sleeps until it is due, so waiting requests are served in order
+    and the rate stays just under the limit. Without a state file the bucket is only shared within this process."""
+
+    def __init__(self, path: Optional[str], rate: float, burst: float):
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._state = (burst, time.time())
+
+        if path and fcntl:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @staticmethod
+    def from_options(engine: str, options: argparse.Namespace) -> Optional["RateLimiter"]:
+        """Create the rate limiter configured on the command line, or return None if the rate is unlimited"""
+        if options.max_rps <= 0:
+            return None
+        rate = options.max_rps
+        burst = options.burst if options.burst > 0 else max(1.0, rate)
+        path = os.path.join(options.cache_dir or default_cache_dir(), f'ratelimit-{engine}.bin')
+        try:
+            return RateLimiter(path, rate, burst)
+        except OSError as e:
+            _warning(f'[WARNING] Rate limit is not shared with other processes, could not open {path}: {e}')
+            return RateLimiter(None, rate, burst)
+
+    def acquire(self, deadline: Optional[Deadline] = None) -> bool:
+        """Take a token from the bucket, waiting until one is available.
+        Return False without taking one if it would not be available before the deadline."""
+        max_delay = deadline.remaining() if deadline else None
+        with self._lock:
+            if self._fd is None:
+                delay = self._reserve(max_delay)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+                try:
+                    data = os.pread(self._fd, _STATE.size, 0)
+                    # A new or damaged state file starts out with a full bucket
+                    self._state = _STATE.unpack(data) if len(data) == _STATE.size else (self.burst, time.time())
+                    delay = self._reserve(max_delay)
+                    os.pwrite(self._fd, _STATE.pack(*self._state), 0)
+                finally:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def _reserve(self, max_delay: Optional[float] = None) -> Optional[float]:
+        """Refill the bucket and take a token from it, return how long to wait until the token is due.
+        If that would be longer than max_delay, return None and leave the token in the bucket."""
+        tokens, updated = self._state
+        now = time.time()
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+        delay = (1 - tokens) / self.rate if tokens < 1 else 0.0
+        if max_delay is not None and delay > max_delay:
+            self._state = (tokens, now)
+            return None
+        self._state = (tokens - 1, now)
+        return delay
+
+    def close(self) -> None:
+        """Close the state file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
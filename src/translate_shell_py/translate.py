@@ -4,18 +4,30 @@ import os
 import re
 import subprocess
 import sys
+import time
 import urllib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 from urllib.parse import quote
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from .audio import play_remote_audio
-from .langdata import get_code, is_rtl, get_name
-from .misc import _has_fribidi
+from .breaker import CircuitBreaker
+from .cache import TranslationCache
+from .concurrency import AdaptiveConcurrency, LatencyTracker, SingleFlight
+from .deadline import Deadline
+from .langdata import get_code
+from .output import OutputSink
+from .pipeline import ordered_map
+from .ratelimit import RateLimiter
 from .theme import prettify
+from .transport import HttpTransport
+
+T = TypeVar('T')
 
 
 def _escape_text(text: str) -> str:
@@ -38,6 +50,17 @@ def format_phonetics(phonetics: str, lang: str) -> str:
     return f'/{phonetics}/' if lang == 'en' else f'({phonetics})'
 
 
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group items into lists of at most size consecutive items"""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class TranslationError(Exception):
+    """Raised when a translation request fails after all retries"""
+
+
 @dataclass
 class Translation:
     tty_output: str
@@ -46,84 +69,74 @@ class Translation:
     audio_fragments: List[Tuple[str, str]]
 
 
+def _failed_translation(target_lang: str) -> Translation:
+    """Return the empty translation that keeps the place of a failed one in the output"""
+    return Translation('', '', target_lang, [])
+
+
 class TranslationEngine(metaclass=abc.ABCMeta):
     """Main translation engine class"""
 
+    # Engine name as used on the command line, also identifies the engine in cache keys
+    name: str = ''
+
+    # Seconds to wait before hedging while too few response times are known to derive the delay from
+    HEDGE_DEFAULT_DELAY = 1.0
+
+    # Options the pools, executors, cache and circuit breaker of an engine are built from. An engine that outlives a
+    # single run is only reused for runs that agree on all of them.
+    BUILD_OPTIONS = ('jobs', 'pool_size', 'no_cache', 'cache_dir', 'cache_ttl', 'cache_size', 'breaker_threshold',
+                     'breaker_timeout')
+
     def __init__(self, options: argparse.Namespace):
         self.options: argparse.Namespace = options
         self.http_auth_user = ''
         self.http_auth_pass = ''
         self.cookie = ''
-        self.pager = ''
-
-    def http_get(self, url: str) -> str:
+        self.output: Optional[OutputSink] = None
+        self.rate_limiter = RateLimiter.from_options(self.name, options)
+        self.concurrency = AdaptiveConcurrency(max(1, options.jobs))
+        self.transport = HttpTransport(options, self.rate_limiter, self.concurrency)
+        self.cache = TranslationCache.from_options(options)
+        self.requests_in_flight = SingleFlight()
+        self.breaker = CircuitBreaker(max(1, options.breaker_threshold), options.breaker_timeout)
+        # Engine that takes over translations which fail with this one, set up by the CLI
+        self.fallback: Optional[TranslationEngine] = None
+        self.executor = ThreadPoolExecutor(max_workers=max(1, options.jobs), thread_name_prefix=f'{self.name}-request')
+        # Hedged translations run here, separately from the targets that wait for them
+        self.hedge_executor = ThreadPoolExecutor(max_workers=2 * max(1, options.jobs),
+                                                 thread_name_prefix=f'{self.name}-hedge')
+        self.latencies = LatencyTracker()
+
+    def can_reuse(self, options: argparse.Namespace) -> bool:
+        """Check if the engine was built with the settings that options ask for"""
+        return all(getattr(self.options, name, None) == getattr(options, name, None) for name in self.BUILD_OPTIONS)
+
+    def update_options(self, options: argparse.Namespace) -> None:
+        """Use new options for subsequent translations, for engines that outlive a single run.
+        The options must agree with the current ones on BUILD_OPTIONS, see can_reuse()."""
+        self.close_output()
+        self.options = options
+        self.transport.options = options
+        if self.rate_limiter:
+            self.rate_limiter.close()
+        self.rate_limiter = self.transport.rate_limiter = RateLimiter.from_options(self.name, options)
+
+    def http_get(self, url: str, deadline: Optional[Deadline] = None) -> bytes:
         """Send an HTTP GET request and get response from online translator"""
+        return self._http_request('GET', url, deadline=deadline)
 
-        # Prepare headers
-        headers = {
-            'Connection': 'close'
-        }
-        if self.options.user_agent:
-            headers['User-Agent'] = self.options.user_agent
-
-        # Prepare authentication
-        auth = None
-        if self.http_auth_user and self.http_auth_pass:
-            auth = HTTPBasicAuth(self.http_auth_user, self.http_auth_pass)
-
-        # Prepare cookies
-        cookies = {}
-        if self.cookie:
-            # Parse cookie string into dict if needed
-            if isinstance(self.cookie, str):
-                for cookie_pair in self.cookie.split(';'):
-                    if '=' in cookie_pair:
-                        key, value = cookie_pair.strip().split('=', 1)
-                        cookies[key] = value
-            else:
-                cookies = self.cookie
-
-        try:
-            response = requests.get(
-                url,
-                headers=headers,
-                cookies=cookies,
-                auth=auth,
-                timeout=30,
-                allow_redirects=True  # Handle redirects automatically
-            )
-
-            if response.status_code == 429:
-                _error(
-                    f'[ERROR] {self.options.engine.title()} did not return results because rate limiting is in effect')
-                return ''
-
-            # Raise an exception for HTTP error status codes (4xx, 5xx)
-            response.raise_for_status()
-
-            return response.text
-
-        except requests.exceptions.Timeout:
-            _warning('[WARNING] Request timed out')
-            return ''
-        except requests.exceptions.ConnectionError as e:
-            _warning(f'[WARNING] Connection error: {e}')
-            return ''
-        except requests.exceptions.HTTPError:
-            _error(
-                f'[ERROR] {self.options.engine.title()} returned an error response. HTTP status code: {response.status_code}')
-            return ''
-        except requests.exceptions.RequestException as e:
-            _warning(f'[WARNING] Request error: {e}')
-            return ''
-
-    def http_post(self, url: str, content: str, content_type: str = None) -> str:
+    def http_post(self, url: str, content: str, content_type: str = None, deadline: Optional[Deadline] = None
+                  ) -> bytes:
         """Send an HTTP POST request and return response from online translator"""
+        return self._http_request('POST', url, content, content_type, deadline)
+
+    def _http_request(self, method: str, url: str, content: str = None, content_type: str = None,
+                      deadline: Optional[Deadline] = None) -> bytes:
+        """Send an HTTP request through the engine's pooled transport, return the raw response body"""
 
         # Prepare headers
-        headers = {
-            'Connection': 'close'
-        }
+        headers = {}
         if content_type:
             headers['Content-Type'] = content_type
         if self.options.user_agent:
@@ -146,60 +159,71 @@ class TranslationEngine(metaclass=abc.ABCMeta):
             else:
                 cookies = self.cookie
 
+        return self.transport.request(method, url, content, headers=headers, auth=auth, cookies=cookies,
+                                      deadline=deadline)
+
+    def cached_request(self, text: str, sl: str, tl: str, hl: str, fetch: Callable[[], bytes],
+                       fields: Iterable[str] = ()) -> bytes:
+        """Return the cached raw response for a translation request, or perform the request and cache its response.
+        Requests for a subset of the response fields are told apart by the fields.
+
+        Identical requests made at the same time, e.g. for repeated input lines, are sent only once and share the
+        response. Raises TranslationError if the request fails, the reason has already been reported by the transport."""
+        key = TranslationCache.make_key(self.name, sl, tl, hl, not self.options.no_autocorrect, text, fields)
+        return self.requests_in_flight.do(key, lambda: self._fetch_cached(key, sl, tl, fetch))
+
+    def _fetch_cached(self, key: str, sl: str, tl: str, fetch: Callable[[], bytes]) -> bytes:
+        """Look up a response in the cache, or perform the request and cache its response"""
+        use_cache = self.cache and not self.options.no_cache
+        if use_cache:
+            content = self.cache.get(key)
+            if content is not None:
+                return content
+
+        if not self.breaker.allow():
+            raise TranslationError(f'{self.name.title()} is unavailable')
         try:
-            response = requests.post(
-                url,
-                content,
-                headers=headers,
-                cookies=cookies,
-                auth=auth,
-                timeout=30,
-                allow_redirects=True  # Handle redirects automatically
-            )
-
-            if response.status_code == 429:
-                _error(
-                    f'[ERROR] {self.options.engine.title()} did not return results because rate limiting is in effect')
-                return ''
-
-            # Raise an exception for HTTP error status codes (4xx, 5xx)
-            response.raise_for_status()
-
-            return response.text
-
-        except requests.exceptions.Timeout:
-            _warning('[WARNING] Request timed out')
-            return ''
-        except requests.exceptions.ConnectionError as e:
-            _warning(f'[WARNING] Connection error: {e}')
-            return ''
-        except requests.exceptions.HTTPError:
-            _error(
-                f'[ERROR] {self.options.engine.title()} returned an error response. HTTP status code: {response.status_code}')
-            return ''
-        except requests.exceptions.RequestException as e:
-            _warning(f'[WARNING] Request error: {e}')
-            return ''
+            content = fetch()
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        # Never cache failed requests
+        if not content:
+            if self.options.run_deadline.expired():
+                # Requests cut short at the end of the run say nothing about the engine, but a probe among them has to
+                # be given up, or the circuit would stay half-open and reject all later runs of a resident engine
+                self.breaker.release_probe()
+            elif self.breaker.record_failure():
+                _warning(f'[WARNING] {self.name.title()} keeps failing, pausing its requests for '
+                         f'{self.breaker.reset_timeout:g} seconds')
+            raise TranslationError(f'{self.name.title()} request failed for {sl}:{tl}')
+        self.breaker.record_success()
+        if use_cache:
+            self.cache.put(key, content)
+        return content
+
+    def close(self) -> None:
+        """Release resources held by the engine"""
+        self.close_output()
+        self.executor.shutdown(cancel_futures=True)
+        self.hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self.transport.close()
+        if self.rate_limiter:
+            self.rate_limiter.close()
+        if self.cache:
+            self.cache.close()
 
     def print_output(self, string: str) -> None:
         """Print a string to output file or terminal pager"""
-        if self.options.view and self.pager:
-            pager_cmd = self.pager
-            if self.pager == 'less':
-                pager_cmd += ' -R'
+        if self.output is None:
+            self.output = OutputSink(self.options)
+        self.output.write(string)
 
-            try:
-                proc = subprocess.Popen(pager_cmd.split(), stdin=subprocess.PIPE, text=True)
-                proc.communicate(input=string)
-            except Exception:
-                print(string)
-        else:
-            output_file = self.options.output or sys.stdout
-            if hasattr(output_file, 'write'):
-                output_file.write(string + '\n')
-            else:
-                with open(output_file, 'a') as f:
-                    f.write(string + '\n')
+    def close_output(self) -> None:
+        """Flush and close the output of the current run"""
+        if self.output:
+            self.output.close()
+            self.output = None
 
     def file_translation(self, uri: str) -> None:
         """Translate a file"""
@@ -233,21 +257,118 @@ class TranslationEngine(metaclass=abc.ABCMeta):
 
     def translate(self, text: str, source_lang: str, inline: bool = False) -> List[Translation]:
         """Translate the source text into all target languages"""
+        host_lang = self._check_languages(source_lang)
+
+        # Process all target languages
+        target_langs = self.options.target_langs or []
+        is_uri = inline and (text.startswith('file://') or text.startswith('http://') or text.startswith('https://'))
+        translations = []
+        if not is_uri and not self.options.no_translate:
+            translations = self._translate_targets(text, source_lang, target_langs, host_lang,
+                                                   self._translation_deadline())
+
+        self._output_translations(text, source_lang, host_lang, translations, inline)
+        return translations
+
+    def _check_languages(self, source_lang: str) -> str:
+        """Warn about unknown or unsupported source and host languages, return the host language to use"""
         # Check source language
         if not get_code(source_lang):
             _warning(f'[WARNING] Unknown source language code: {source_lang}')
-        elif is_rtl(source_lang) and not _has_fribidi():
-            _warning(f'[WARNING] {get_name(source_lang)} is a right-to-left language, but FriBidi is not found.')
 
         # Check host language
         host_lang = self.options.host_lang
         if not get_code(host_lang):
             _warning(f'[WARNING] Unknown language code: {host_lang}, fallback to English: en')
             host_lang = 'en'
-        elif is_rtl(host_lang) and not _has_fribidi():
-            _warning(f'[WARNING] {get_name(host_lang)} is a right-to-left language, but FriBidi is not found.')
 
-        # Process all target languages
+        return host_lang
+
+    def _translation_deadline(self) -> Deadline:
+        """Return the deadline for translating a text, or a batch of texts, into all target languages"""
+        return Deadline.earliest(Deadline(self.options.translation_timeout), self.options.run_deadline)
+
+    def _translate_targets(self, text: str, source_lang: str, target_langs: List[str], host_lang: str,
+                           deadline: Optional[Deadline] = None) -> List[Translation]:
+        """Translate the text into several target languages concurrently, results are in the order of target_langs"""
+        with_fallback = self._hedged if self.options.hedge > 0 and self.fallback else self._with_fallback
+
+        def translate_into(target_lang: str) -> Translation:
+            return with_fallback(
+                lambda engine: engine._translate(
+                    text, source_lang, target_lang, host_lang,
+                    self.options.verbose,
+                    #self.options.play_mode or self.options.download_audio,
+                    #playlist, il
+                    deadline=deadline
+                ),
+                lambda: _failed_translation(target_lang))
+
+        return self._for_each_target(translate_into, target_langs)
+
+    def _translate_batch_targets(self, texts: List[str], source_lang: str, target_langs: List[str], host_lang: str,
+                                 deadline: Optional[Deadline] = None) -> List[List[Translation]]:
+        """Translate several texts into several target languages, results are per text in the order of target_langs"""
+        def translate_into(target_lang: str) -> List[Translation]:
+            return self._with_fallback(
+                lambda engine: engine._translate_batch(texts, source_lang, target_lang, host_lang, deadline),
+                lambda: [_failed_translation(target_lang) for _ in texts])
+
+        per_target = self._for_each_target(translate_into, target_langs)
+        return [[translations[i] for translations in per_target] for i in range(len(texts))]
+
+    def _with_fallback(self, fn: Callable[["TranslationEngine"], T], on_failure: Callable[[], T]) -> T:
+        """Call fn with this engine, and with the fallback engine if that fails. Return on_failure() if both fail."""
+        for engine in (self, self.fallback):
+            if engine is None:
+                continue
+            try:
+                return fn(engine)
+            except TranslationError:
+                pass
+        return on_failure()
+
+    def _hedged(self, fn: Callable[["TranslationEngine"], T], on_failure: Callable[[], T]) -> T:
+        """Call fn with this engine, and also with the fallback engine once this one has taken longer than the --hedge
+        percentile of its recent response times, or has failed. The first successful result wins, the other call is
+        cancelled if it has not started yet and its result is dropped otherwise. Return on_failure() if both fail."""
+        delay = self.latencies.percentile(self.options.hedge, self.HEDGE_DEFAULT_DELAY)
+        started = time.monotonic()
+
+        def call_primary() -> T:
+            result = fn(self)
+            self.latencies.record(time.monotonic() - started)
+            return result
+
+        pending = {self.hedge_executor.submit(call_primary)}
+        is_hedged = False
+        while pending:
+            done, pending = wait(pending, timeout=None if is_hedged else delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except TranslationError:
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                return result
+            if not is_hedged:
+                is_hedged = True
+                pending.add(self.hedge_executor.submit(fn, self.fallback))
+        return on_failure()
+
+    def _for_each_target(self, fn: Callable[[str], T], target_langs: List[str]) -> List[T]:
+        """Call fn for all target languages concurrently, results are in the order of target_langs"""
+        # Spare the thread hand-off if there is only a single request to make
+        if len(target_langs) <= 1:
+            return [fn(target_lang) for target_lang in target_langs]
+
+        futures = [self.executor.submit(fn, target_lang) for target_lang in target_langs]
+        return [future.result() for future in futures]
+
+    def _output_translations(self, text: str, source_lang: str, host_lang: str, translations: List[Translation],
+                             inline: bool = False) -> None:
+        """Print the translations of a text and play their audio, in the order of the target languages"""
         target_langs = self.options.target_langs or []
         for i, target_lang in enumerate(target_langs, 1):
             # Non-interactive verbose mode: separator between targets
@@ -263,12 +384,7 @@ class TranslationEngine(metaclass=abc.ABCMeta):
             else:
 
                 if not self.options.no_translate:
-                    translation = self._translate(
-                        text, source_lang, target_lang, host_lang,
-                        self.options.verbose,
-                        #self.options.play_mode or self.options.download_audio,
-                        #playlist, il
-                    )
+                    translation = translations[i - 1]
                     self.print_output(translation.tty_output)
                 else:
                     # TODO: test if this works and has a use case
@@ -288,31 +404,60 @@ class TranslationEngine(metaclass=abc.ABCMeta):
                 #        self._download_audio(text, identified_lang)
 
     def translate_stdin(self) -> None:
-        """Read from input and translate each line"""
+        """Read from input and translate each line.
+
+        Lines are read lazily and translated concurrently by a bounded pool of workers. Results pass through a reorder
+        buffer, so they are printed in input order while memory use stays flat regardless of the input size."""
 
         input_source = self.options.input or sys.stdin
 
-        if input_source == sys.stdin or os.path.isfile(str(input_source)):
-            lines = []
-            if hasattr(input_source, 'read'):
-                lines = input_source.read().splitlines()
-            else:
-                with open(input_source, 'r', encoding='utf-8') as f:
-                    lines = f.read().splitlines()
+        if input_source != sys.stdin and not os.path.isfile(str(input_source)):
+            _error(f'[ERROR] File not found: {input_source}')
+            return
 
-            for i, line in enumerate(lines):
-                if len(line.strip()) == 0:
-                    # Preserve line breaks
-                    self.print_output(line)
-                else:
-                    if self.options.verbose and i > 0:
-                        separator = self.options.get('chr-source-separator', '=') * self.options.get('width', 80)
-                        self.print_output(prettify('source-separator', separator))
+        source_lang = self.options.source_lang
+        host_lang = self._check_languages(source_lang)
+        target_langs = self.options.target_langs or []
 
-                    translations = self.translate(line, self.options.source_lang)
-                    # TODO: do printing and audio here
-        else:
-            _error(f'[ERROR] File not found: {input_source}')
+        # Batches only carry the bare translations, so they are restricted to brief output
+        batch_size = self.options.batch if not self.options.verbose and not self.options.dump else 0
+
+        def translate_lines(lines: List[str]) -> List[Tuple[str, List[Translation]]]:
+            texts = [line for line in lines if len(line.strip()) > 0]
+            if not texts or self.options.no_translate:
+                return [(line, []) for line in lines]
+            if len(texts) == 1:
+                per_text = iter([self._translate_targets(texts[0], source_lang, target_langs, host_lang,
+                                                         self._translation_deadline())])
+            else:
+                per_text = iter(self._translate_batch_targets(texts, source_lang, target_langs, host_lang,
+                                                              self._translation_deadline()))
+            return [(line, next(per_text) if len(line.strip()) > 0 else []) for line in lines]
+
+        jobs = max(1, self.options.jobs)
+        line_executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix=f'{self.name}-line')
+        try:
+            with (nullcontext(input_source) if hasattr(input_source, 'read')
+                  else open(input_source, 'r', encoding='utf-8')) as f:
+                lines = (line.rstrip('\r\n') for line in f)
+                batches = _batched(lines, max(1, batch_size))
+                results = chain.from_iterable(ordered_map(translate_lines, batches, line_executor, buffer_size=4 * jobs))
+                for i, (line, translations) in enumerate(results):
+                    if len(line.strip()) == 0:
+                        # Preserve line breaks
+                        self.print_output(line)
+                    else:
+                        if self.options.verbose and i > 0:
+                            separator = '=' * (self.options.width or 80)
+                            self.print_output(prettify('source-separator', separator))
+
+                        self._output_translations(line, source_lang, host_lang, translations)
+
+                    if self.options.run_deadline.expired():
+                        _error('[ERROR] Time budget of the run is exhausted, the remaining input is not translated')
+                        break
+        finally:
+            line_executor.shutdown(cancel_futures=True)
 
     def play_audio_multiple(self, fragments: List[Tuple[str, str]]):
         if self.options.audio_mode > 0 and self.options.audio_player:
@@ -352,16 +497,25 @@ class TranslationEngine(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def _translate(self, text: str, source_lang: str, target_lang: str, host_lang: str
                    , is_verbose: bool
+                   , deadline: Optional[Deadline] = None
                    # TODO: implement these features or remove
                    #, to_speech: bool
                    #, return_playlist: Optional[List]
                    #, return_il: Optional[List]
                    ) -> Translation:
-        """Core translation function - to be implemented by specific engines.
+        """Core translation function - to be implemented by specific engines. All requests made for the translation
+        have to be finished by the deadline.
 
         :return: Tuple[str, str]: formatted translator output and the identified language of the input"""
         pass
 
+    def _translate_batch(self, texts: List[str], source_lang: str, target_lang: str, host_lang: str,
+                         deadline: Optional[Deadline] = None) -> List[Translation]:
+        """Translate several texts into one target language. Engines may override this to pack the texts into fewer
+        requests, by default each text is translated on its own."""
+        return [self._translate(text, source_lang, target_lang, host_lang, self.options.verbose, deadline)
+                for text in texts]
+
     def _download_audio(self, text: str, lang: str) -> None:
         """Download audio for text"""
         pass  # Placeholder
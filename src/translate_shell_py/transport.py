@@ -0,0 +1,195 @@
+import argparse
+import email.utils
+import random
+import sys
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+from .concurrency import AdaptiveConcurrency
+from .deadline import Deadline
+from .ratelimit import RateLimiter
+
+
+def _error(message: str) -> None:
+    """Print error message"""
+    print(message, file=sys.stderr)
+
+
+def _warning(message: str) -> None:
+    """Print warning message"""
+    print(message, file=sys.stderr)
+
+
+# Responses that are worth asking for again: rate limiting and temporary server failures
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Backoff before the n-th retry is drawn uniformly from [0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (n - 1))]
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+# Shortest timeout given to a request that is about to hit its deadline, as a timeout of zero is not accepted
+MIN_TIMEOUT = 0.01
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return a jittered exponential backoff delay in seconds after the given failed attempt"""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, given either in seconds or as an HTTP date, into a delay in seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HttpTransport:
+    """Pooled keep-alive HTTP transport, owned by a single translation engine.
+
+    All requests of an engine go through one session, so connections (and TLS sessions) to the translation endpoints
+    are reused across translations instead of being re-established for every single request."""
+
+    def __init__(self, options: argparse.Namespace, rate_limiter: Optional[RateLimiter] = None,
+                 concurrency: Optional[AdaptiveConcurrency] = None):
+        self.options: argparse.Namespace = options
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+
+        pool_size = max(1, options.pool_size)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method: str, url: str, content: Optional[str] = None, headers: Optional[Dict[str, str]] = None,
+                auth: Optional[HTTPBasicAuth] = None, cookies: Optional[Dict[str, str]] = None,
+                deadline: Optional[Deadline] = None) -> bytes:
+        """Send an HTTP request over the pooled session and return the raw response body, or b'' on failure.
+
+        Rate limiting, server errors, timeouts and connection errors are retried with jittered exponential backoff, or
+        after the delay asked for by a Retry-After header. Retries stop after --max-attempts attempts, or when the next
+        one could not start within --retry-budget seconds of the first.
+
+        Connecting and waiting for the response are limited by --connect-timeout and --read-timeout, and no attempt
+        runs past the deadline of the request.
+
+        The outcome of every attempt is fed to the adaptive concurrency limit, which bounds the requests in flight."""
+        max_attempts = max(1, self.options.max_attempts)
+        deadline = deadline or Deadline()
+        retry_deadline = Deadline.earliest(Deadline(self.options.retry_budget), deadline)
+
+        for attempt in range(1, max_attempts + 1):
+            retry_after = None
+            response = None
+            # Waiting for the rate limit and for a free slot ends at the deadline, a request that could only be sent
+            # after it fails without being sent
+            if (deadline.expired() or (self.rate_limiter and not self.rate_limiter.acquire(deadline))
+                    or (self.concurrency and not self.concurrency.acquire(deadline))):
+                _warning('[WARNING] Request deadline exceeded')
+                return b''
+            started = time.monotonic()
+            try:
+                if deadline.expired():
+                    _warning('[WARNING] Request deadline exceeded')
+                    return b''
+                response = self.session.request(
+                    method,
+                    url,
+                    data=content,
+                    headers=headers,
+                    cookies=cookies,
+                    auth=auth,
+                    timeout=(max(MIN_TIMEOUT, deadline.clamp(self.options.connect_timeout)),
+                             max(MIN_TIMEOUT, deadline.clamp(self.options.read_timeout))),
+                    allow_redirects=True  # Handle redirects automatically
+                )
+
+                if response.status_code in RETRY_STATUS_CODES:
+                    self._record_congestion()
+
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    report, level, message = _error, '[ERROR]', (f'{self.options.engine.title()} did not return results '
+                                                                 f'because rate limiting is in effect')
+                elif response.status_code in RETRY_STATUS_CODES:
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    report, level, message = _error, '[ERROR]', (f'{self.options.engine.title()} returned an error '
+                                                                 f'response. HTTP status code: {response.status_code}')
+                else:
+                    # Raise an exception for HTTP error status codes (4xx, 5xx)
+                    response.raise_for_status()
+
+                    self._record_success(time.monotonic() - started)
+                    return response.content
+
+            except requests.exceptions.Timeout:
+                if deadline.expired():
+                    # Cut short by the deadline, which says nothing about congestion
+                    _warning('[WARNING] Request deadline exceeded')
+                    return b''
+                self._record_congestion()
+                report, level, message = _warning, '[WARNING]', 'Request timed out'
+            except requests.exceptions.ConnectionError as e:
+                self._record_congestion()
+                report, level, message = _warning, '[WARNING]', f'Connection error: {e}'
+            except requests.exceptions.HTTPError:
+                # Other client errors will not go away by asking again
+                _error(
+                    f'[ERROR] {self.options.engine.title()} returned an error response. HTTP status code: {response.status_code}')
+                return b''
+            except requests.exceptions.RequestException as e:
+                _warning(f'[WARNING] Request error: {e}')
+                return b''
+            finally:
+                if self.concurrency:
+                    self.concurrency.release()
+
+            delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            remaining = retry_deadline.remaining()
+            if attempt == max_attempts or (remaining is not None and delay > remaining):
+                report(f'{level} {message}')
+                return b''
+            # Only the final failure is reported as such, attempts that are retried show up in debug output
+            if self.options.debug:
+                _warning(f'[DEBUG] {message}, retrying in {delay:.1f}s (attempt {attempt + 1} of {max_attempts})')
+            time.sleep(delay)
+
+        return b''
+
+    def _record_success(self, latency: float) -> None:
+        """Let the concurrency limit grow after a healthy response"""
+        if self.concurrency:
+            self._show_concurrency(self.concurrency.record_success(latency))
+
+    def _record_congestion(self) -> None:
+        """Cut the concurrency limit after rate limiting, a server error or a timeout"""
+        if self.concurrency:
+            self._show_concurrency(self.concurrency.record_congestion())
+
+    def _show_concurrency(self, limit: Optional[int]) -> None:
+        """Show a changed concurrency limit in debug output"""
+        if limit is not None and self.options.debug:
+            _warning(f'[DEBUG] {self.options.engine.title()} concurrency limit: {limit}')
+
+    def get_cookies(self) -> Dict[str, str]:
+        """Return the cookies collected by the session"""
+        return requests.utils.dict_from_cookiejar(self.session.cookies)
+
+    def set_cookies(self, cookies: Dict[str, str]) -> None:
+        """Add cookies to the session"""
+        self.session.cookies.update(cookies)
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()